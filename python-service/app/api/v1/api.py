@@ -3,10 +3,12 @@ API v1 router configuration.
 """
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 
 from .endpoints import health, langgraph_v2, targets
 
-api_router = APIRouter()
+# Sub-routers inherit ORJSONResponse unless a route sets its own response class
+api_router = APIRouter(default_response_class=ORJSONResponse)
 
 # Include all endpoint routers
 api_router.include_router(health.router, prefix="/health", tags=["health"])
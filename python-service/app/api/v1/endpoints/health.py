@@ -70,46 +70,74 @@ async def check_dependency_health() -> Dict[str, str]:
     return dependencies
 
 
-async def check_detailed_dependency_health() -> Dict[str, Dict[str, Any]]:
-    """Check detailed health of external dependencies."""
-    dependencies = {}
-    
-    # Google Sheets detailed check
-    google_sheets_status = {
+async def _probe_google_sheets() -> Dict[str, Any]:
+    """Check Google Sheets configuration."""
+    status = {
         "status": "not_configured",
         "last_check": datetime.utcnow().isoformat(),
         "error": None
     }
     
     if settings.GOOGLE_SHEETS_CREDENTIALS_PATH or settings.GOOGLE_SHEETS_CREDENTIALS_JSON:
-        google_sheets_status["status"] = "configured"
+        status["status"] = "configured"
         if settings.GOOGLE_SHEETS_SPREADSHEET_ID:
-            google_sheets_status["spreadsheet_configured"] = True
+            status["spreadsheet_configured"] = True
         else:
-            google_sheets_status["spreadsheet_configured"] = False
-    
-    dependencies["google_sheets"] = google_sheets_status
+            status["spreadsheet_configured"] = False
     
-    # Gemini API detailed check
-    gemini_status = {
+    return status
+
+
+async def _probe_gemini() -> Dict[str, Any]:
+    """Check Gemini API configuration."""
+    return {
         "status": "configured" if settings.GEMINI_API_KEY else "not_configured",
         "last_check": datetime.utcnow().isoformat(),
         "error": None
     }
-    dependencies["gemini_api"] = gemini_status
-    
-    # Redis detailed check
-    redis_status = {
+
+
+async def _probe_redis() -> Dict[str, Any]:
+    """Check Redis configuration."""
+    status = {
         "status": "not_configured",
         "last_check": datetime.utcnow().isoformat(),
         "error": None
     }
     
     if settings.REDIS_URL:
-        redis_status["status"] = "configured"
+        status["status"] = "configured"
         # In a real implementation, we would test actual Redis connectivity here
     
-    dependencies["redis"] = redis_status
+    return status
+
+
+# Dependency probes for the detailed health check, run concurrently
+_DETAILED_PROBES = {
+    "google_sheets": _probe_google_sheets,
+    "gemini_api": _probe_gemini,
+    "redis": _probe_redis
+}
+
+
+async def check_detailed_dependency_health() -> Dict[str, Dict[str, Any]]:
+    """Check detailed health of external dependencies."""
+    # Probes are independent, so the check takes as long as the slowest one
+    results = await asyncio.gather(
+        *(probe() for probe in _DETAILED_PROBES.values()),
+        return_exceptions=True
+    )
+    
+    dependencies = {}
+    for name, result in zip(_DETAILED_PROBES, results):
+        if isinstance(result, Exception):
+            logger.warning("Dependency probe failed", dependency=name, error=str(result))
+            result = {
+                "status": "unavailable",
+                "last_check": datetime.utcnow().isoformat(),
+                "error": str(result)
+            }
+        dependencies[name] = result
     
     return dependencies
 
@@ -3,11 +3,16 @@ LangGraph V2 API endpoints - Completely rewritten following official LangGraph p
 This demonstrates TRUE AGENTIC BEHAVIOR with the rewritten agent implementation.
 """
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, Optional
+from datetime import datetime
+from decimal import Decimal
 import logging
 
+import orjson
+
 from ....services.langgraph_service_v2 import get_langgraph_service_v2, LangGraphServiceV2
 
 logger = logging.getLogger(__name__)
@@ -29,6 +34,20 @@ class ChatResponse(BaseModel):
     error: Optional[str] = None
 
 
+_CHAT_RESPONSE_FIELDS = tuple(ChatResponse.model_fields)
+
+
+def _default_encoder(value: Any) -> Any:
+    """Convert values orjson can't serialize natively (it handles datetime and UUID itself)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
 @router.post("/chat", response_model=ChatResponse)
 async def chat_with_rewritten_agent(
     request: ChatRequest,
@@ -53,13 +72,58 @@ async def chat_with_rewritten_agent(
     """
     try:
         result = await service.chat(request.message, request.session_id)
-        return ChatResponse(**result)
+        
+        # Serialize directly instead of returning the model, which would send the
+        # nested agentic_flow data through jsonable_encoder before serialization
+        payload = {field: result.get(field) for field in _CHAT_RESPONSE_FIELDS}
+        payload["success"] = bool(payload["success"])
+        payload["session_id"] = payload["session_id"] or request.session_id or "unknown"
+        return Response(
+            content=orjson.dumps(payload, default=_default_encoder, option=orjson.OPT_NON_STR_KEYS),
+            media_type="application/json"
+        )
         
     except Exception as e:
         logger.error(f"Error in chat endpoint: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> bytes:
+    """Format one Server-Sent Events message"""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post("/chat/stream")
+async def stream_chat_with_rewritten_agent(
+    request: ChatRequest,
+    service: LangGraphServiceV2 = Depends(get_langgraph_service_v2)
+):
+    """
+    Chat with the agent, streaming the answer as Server-Sent Events.
+    
+    Each token arrives as a `data: {"token": ...}` event as soon as Gemini
+    produces it, followed by a final `done` event (or an `error` event).
+    Use /chat for a single JSON response instead.
+    """
+    session_id = request.session_id or f"session_{datetime.utcnow().timestamp()}"
+    
+    async def event_stream() -> AsyncIterator[bytes]:
+        try:
+            async for token in service.chat_stream(request.message):
+                yield _sse_event({"token": token})
+            yield _sse_event({"session_id": session_id}, event="done")
+        except Exception as e:
+            logger.error(f"Error in streaming chat endpoint: {e}")
+            yield _sse_event({"error": str(e), "session_id": session_id}, event="error")
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/status")
 async def get_service_status_v2(
     service: LangGraphServiceV2 = Depends(get_langgraph_service_v2)
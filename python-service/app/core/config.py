@@ -26,8 +26,15 @@ class Settings(BaseSettings):
     
     # AI Services
     GEMINI_API_KEY: Optional[str] = None
+    LLM_CACHE_TTL_SECONDS: int = 600  # Set to 0 to disable the LLM response cache
+    LLM_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_TTL_SECONDS: int = 300  # Set to 0 to disable the query response cache
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    DEBUG_PROMPTS: bool = False  # Indent JSON sections of LLM prompts for readability
+    WARMUP_ON_START: bool = False  # Send a warm-up LLM call and preload sheet data at startup
     
     # Database/Cache
+    SHEETS_CACHE_TTL_SECONDS: int = 300  # Repository cache of sheet reads; 0 always reads the sheet
     REDIS_URL: Optional[str] = "redis://localhost:6379"
     
     # Security
@@ -2,12 +2,17 @@
 Structured logging configuration using structlog.
 """
 import logging
+import queue
 import structlog
-from typing import Any, Dict
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
 import sys
 
 from .config import settings
 
+# Background listener that writes queued log records to stdout
+_log_listener: Optional[QueueListener] = None
+
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
@@ -31,12 +36,33 @@ def setup_logging() -> None:
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard library logging
+    # Configure standard library logging. Handlers on the event loop only
+    # enqueue records; a listener thread does the blocking stdout writes.
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+    
     logging.basicConfig(
         format="%(message)s",
-        stream=sys.stdout,
+        handlers=[QueueHandler(log_queue)],
         level=getattr(logging, settings.LOG_LEVEL.upper()),
+        force=True,
     )
+    
+    _log_listener = QueueListener(log_queue, stream_handler)
+    _log_listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued log records and stop the background listener."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        _log_listener = None
 
 
 def get_logger(name: str) -> structlog.BoundLogger:
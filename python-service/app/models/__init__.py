@@ -1,5 +1,6 @@
 # Data models package
 from .entities import (
+    EntityModel,
     FunderModel,
     ContributionModel,
     StateTargetModel,
@@ -21,6 +22,7 @@ from .workflow import (
 
 __all__ = [
     # Entity models
+    "EntityModel",
     "FunderModel",
     "ContributionModel", 
     "StateTargetModel",
@@ -41,7 +41,15 @@ class ContactInfo(BaseModel):
         return v
 
 
-class FunderModel(BaseModel):
+class EntityModel(BaseModel):
+    """Base model for stored entities"""
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a fresh dictionary the caller may mutate"""
+        return self.model_dump()
+
+
+class FunderModel(EntityModel):
     """Model for funder entities with validation and business logic"""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique funder identifier")
@@ -110,7 +118,7 @@ class FunderModel(BaseModel):
             self.updated_at = datetime.utcnow()
 
 
-class ContributionModel(BaseModel):
+class ContributionModel(EntityModel):
     """Model for contribution entities with validation and business logic"""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique contribution identifier")
@@ -189,7 +197,7 @@ class ContributionModel(BaseModel):
         self.updated_at = datetime.utcnow()
 
 
-class StateTargetModel(BaseModel):
+class StateTargetModel(EntityModel):
     """Model for state fundraising targets"""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique target identifier")
@@ -255,7 +263,7 @@ class StateTargetModel(BaseModel):
         return values
 
 
-class ProspectModel(BaseModel):
+class ProspectModel(EntityModel):
     """Model for fundraising prospects"""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique prospect identifier")
@@ -346,7 +354,7 @@ class ProspectModel(BaseModel):
         return self.estimated_amount * Decimal(str(self.probability))
 
 
-class StateModel(BaseModel):
+class StateModel(EntityModel):
     """Model for state information"""
     
     code: str = Field(..., min_length=2, max_length=3, description="State code")
@@ -390,7 +398,7 @@ class StateModel(BaseModel):
         return values
 
 
-class SchoolModel(BaseModel):
+class SchoolModel(EntityModel):
     """Model for school information"""
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Unique school identifier")
@@ -7,9 +7,10 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, ClassVar, Dict, List, Optional, Tuple, Union
+from pydantic import BaseModel, Field, PrivateAttr, field_validator
 import json
+import orjson
 import uuid
 
 
@@ -184,21 +185,55 @@ class DataContext(BaseModel):
     last_updated: datetime = Field(default_factory=datetime.utcnow, description="Last update timestamp")
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Context metadata")
     
+    _DATA_FIELDS: ClassVar[frozenset] = frozenset(
+        {"funders", "contributions", "state_targets", "prospects", "states", "schools"}
+    )
+    
+    # Summary and serialized prompt snippets, dropped whenever a data list is reassigned
+    _summary: Optional[Dict[str, int]] = PrivateAttr(default=None)
+    _summary_json: Optional[str] = PrivateAttr(default=None)
+    _sample_json: Dict[Tuple[str, int], str] = PrivateAttr(default_factory=dict)
+    
     class Config:
         json_encoders = {
             datetime: lambda v: v.isoformat()
         }
     
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if name in self._DATA_FIELDS:
+            self._summary = None
+            self._summary_json = None
+            self._sample_json = {}
+    
+    @property
+    def summary_json(self) -> str:
+        """Compact JSON of the data summary, computed once per data update"""
+        if self._summary_json is None:
+            self._summary_json = orjson.dumps(self.get_data_summary()).decode()
+        return self._summary_json
+    
+    def sample_json(self, name: str, n: int = 2) -> str:
+        """Compact JSON of the first n records of a data list, computed once per data update"""
+        key = (name, n)
+        if key not in self._sample_json:
+            self._sample_json[key] = orjson.dumps(
+                getattr(self, name)[:n], default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        return self._sample_json[key]
+    
     def get_data_summary(self) -> Dict[str, int]:
-        """Get summary of data counts"""
-        return {
-            "funders": len(self.funders),
-            "contributions": len(self.contributions),
-            "state_targets": len(self.state_targets),
-            "prospects": len(self.prospects),
-            "states": len(self.states),
-            "schools": len(self.schools)
-        }
+        """Get summary of data counts, computed once per data update"""
+        if self._summary is None:
+            self._summary = {
+                "funders": len(self.funders),
+                "contributions": len(self.contributions),
+                "state_targets": len(self.state_targets),
+                "prospects": len(self.prospects),
+                "states": len(self.states),
+                "schools": len(self.schools)
+            }
+        return dict(self._summary)
     
     def is_stale(self, max_age_minutes: int = 5) -> bool:
         """Check if data context is stale"""
@@ -7,6 +7,7 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from enum import Enum
 from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
 from pydantic import BaseModel
 
@@ -71,6 +72,16 @@ class BaseRepository(Generic[T], ABC):
         self._list_cache: Optional[CacheEntry] = None
         self._cache_lock = asyncio.Lock()
         
+        # Sheet read in flight for get_all, shared by concurrent callers on the same loop
+        self._list_load: Optional[asyncio.Future] = None
+        
+        # Field indexes over the cached entity list (field -> value -> row positions)
+        self._indexes: Dict[str, Dict[Any, List[int]]] = {}
+        self._index_source: Optional[List[T]] = None
+        
+        # Bumped on every write so derived caches can tell when data changed
+        self.data_version = 0
+        
         if not self.spreadsheet_id:
             logger.warning(f"No spreadsheet ID configured for {self.__class__.__name__}")
     
@@ -129,8 +140,11 @@ class BaseRepository(Generic[T], ABC):
                 self._cache.clear()
                 logger.debug(f"Cleared all cache for {self.sheet_name}")
             
-            # Always invalidate list cache
+            # Always invalidate list cache and the indexes built over it
+            self.data_version += 1
             self._list_cache = None
+            self._indexes = {}
+            self._index_source = None
     
     async def _get_list_from_cache(self) -> Optional[List[T]]:
         """Get list of entities from cache."""
@@ -231,38 +245,81 @@ class BaseRepository(Generic[T], ABC):
             if cached_list is not None:
                 return cached_list
             
-            # Read from sheet
-            values = await self.sheets_client.read_range(
-                spreadsheet_id=self.spreadsheet_id,
-                range_name=self._get_range()
-            )
-            
-            entities = []
-            headers = self._get_headers()
-            
-            # Skip header row if present
-            data_rows = values[1:] if values and len(values) > 0 else []
-            
-            for row in data_rows:
-                try:
-                    # Pad row to match headers length
-                    padded_row = row + [''] * (len(headers) - len(row))
-                    entity = self._row_to_model(padded_row)
-                    entities.append(entity)
-                except Exception as e:
-                    logger.warning(f"Failed to parse row {row}: {e}")
-                    continue
-            
-            # Cache the result
-            await self._set_list_cache(entities)
-            
-            logger.debug(f"Retrieved {len(entities)} {self.model_class.__name__} entities")
-            return entities
+            return await self._load_all_shared()
             
         except Exception as e:
             logger.error(f"Failed to get all {self.model_class.__name__} entities: {e}")
             raise
     
+    async def _load_all_shared(self) -> List[T]:
+        """
+        Load the sheet, joining a load already in flight on this event loop.
+        
+        A load started on another event loop can't be awaited here, so callers
+        on a different loop (e.g. a script driving the repository with
+        asyncio.run) read the sheet themselves.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            in_flight = self._list_load
+            if in_flight is None or in_flight.get_loop() is not loop:
+                break
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    # This caller itself was cancelled
+                    raise
+                # The leading load was cancelled, not us; retry, possibly as the new leader
+        
+        future = loop.create_future()
+        self._list_load = future
+        try:
+            entities = await self._load_all()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody waited on isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(entities)
+            return entities
+        finally:
+            if self._list_load is future:
+                self._list_load = None
+    
+    async def _load_all(self) -> List[T]:
+        """Read every row from the sheet, parse it and cache the entity list."""
+        values = await self.sheets_client.read_range(
+            spreadsheet_id=self.spreadsheet_id,
+            range_name=self._get_range()
+        )
+        
+        entities = []
+        headers = self._get_headers()
+        
+        # Skip header row if present
+        data_rows = values[1:] if values and len(values) > 0 else []
+        
+        for row in data_rows:
+            try:
+                # Pad row to match headers length
+                padded_row = row + [''] * (len(headers) - len(row))
+                entity = self._row_to_model(padded_row)
+                entities.append(entity)
+            except Exception as e:
+                logger.warning(f"Failed to parse row {row}: {e}")
+                continue
+        
+        # Cache the result
+        await self._set_list_cache(entities)
+        
+        logger.debug(f"Retrieved {len(entities)} {self.model_class.__name__} entities")
+        return entities
+    
     async def update(self, entity_id: str, updates: Dict[str, Any]) -> Optional[T]:
         """
         Update entity by ID.
@@ -378,6 +435,78 @@ class BaseRepository(Generic[T], ABC):
             logger.error(f"Failed to find {self.model_class.__name__} by {field_name}: {e}")
             raise
     
+    @staticmethod
+    def _index_key(value: Any) -> Any:
+        """Normalize a value for index lookups (str enums hash by name, not value)."""
+        return value.value if isinstance(value, Enum) else value
+    
+    def _build_index(self, entities: List[T], field_name: str) -> Optional[Dict[Any, List[int]]]:
+        """Build a value -> row positions index for a field, or None if unhashable."""
+        index: Dict[Any, List[int]] = {}
+        try:
+            for position, entity in enumerate(entities):
+                if hasattr(entity, field_name):
+                    key = self._index_key(getattr(entity, field_name))
+                    index.setdefault(key, []).append(position)
+        except TypeError:
+            return None
+        return index
+    
+    async def find(self, **filters: Any) -> List[T]:
+        """
+        Find entities matching all equality filters.
+        
+        Lookups go through per-field indexes built lazily over the cached entity
+        list, so repeated queries cost O(matches) instead of a full scan.
+        
+        Args:
+            **filters: Field name / value pairs that must all match
+            
+        Returns:
+            List of matching entities in sheet order
+        """
+        try:
+            entities = await self.get_all()
+            if not filters:
+                return list(entities)
+            
+            # Indexes are only valid for the list they were built from
+            if entities is not self._index_source:
+                self._indexes = {}
+                self._index_source = entities
+            
+            positions: Optional[set] = None
+            for field_name, field_value in filters.items():
+                if field_name not in self._indexes:
+                    self._indexes[field_name] = self._build_index(entities, field_name)
+                index = self._indexes[field_name]
+                
+                field_positions = None
+                if index is not None:
+                    try:
+                        field_positions = set(index.get(self._index_key(field_value), ()))
+                    except TypeError:
+                        pass
+                
+                if field_positions is None:
+                    # Unhashable field or filter value - fall back to a scan
+                    field_positions = {
+                        position for position, entity in enumerate(entities)
+                        if hasattr(entity, field_name) and getattr(entity, field_name) == field_value
+                    }
+                
+                positions = field_positions if positions is None else positions & field_positions
+                if not positions:
+                    return []
+            
+            matches = [entities[position] for position in sorted(positions)]
+            logger.debug(f"Found {len(matches)} {self.model_class.__name__} entities matching {filters}")
+            return matches
+            
+        except Exception as e:
+            logger.error(f"Failed to find {self.model_class.__name__} by {filters}: {e}")
+            raise
+    
     async def batch_create(self, entities: List[T]) -> List[T]:
         """
         Create multiple entities in batch.
@@ -2,8 +2,9 @@
 Repository factory for managing all data access repositories.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from app.services.sheets_client import SheetsClient, get_sheets_client
 from app.core.config import get_settings
@@ -30,7 +31,7 @@ class RepositoryFactory:
         self,
         spreadsheet_id: Optional[str] = None,
         sheets_client: Optional[SheetsClient] = None,
-        cache_ttl: int = 300
+        cache_ttl: Optional[int] = None
     ):
         """
         Initialize the repository factory.
@@ -38,11 +39,11 @@ class RepositoryFactory:
         Args:
             spreadsheet_id: Google Sheets spreadsheet ID
             sheets_client: Optional sheets client instance
-            cache_ttl: Cache time-to-live in seconds
+            cache_ttl: Cache time-to-live in seconds (defaults to SHEETS_CACHE_TTL_SECONDS)
         """
         self.spreadsheet_id = spreadsheet_id or settings.GOOGLE_SHEETS_SPREADSHEET_ID
         self.sheets_client = sheets_client or get_sheets_client()
-        self.cache_ttl = cache_ttl
+        self.cache_ttl = settings.SHEETS_CACHE_TTL_SECONDS if cache_ttl is None else cache_ttl
         
         # Repository instances (lazy-loaded)
         self._funder_repo: Optional[FunderRepository] = None
@@ -52,6 +53,9 @@ class RepositoryFactory:
         self._state_repo: Optional[StateRepository] = None
         self._school_repo: Optional[SchoolRepository] = None
         
+        # In-flight prefetch of the query repositories
+        self._prefetch_task: Optional[asyncio.Task] = None
+        
         logger.info("Repository factory initialized")
     
     @property
@@ -143,6 +147,82 @@ class RepositoryFactory:
         
         logger.info("Cleared all repository caches")
     
+    def get_data_version(self) -> tuple:
+        """
+        Get a token that changes whenever any repository's data is written.
+        
+        Returns:
+            Tuple of per-repository data versions
+        """
+        repositories = [
+            self._funder_repo,
+            self._contribution_repo,
+            self._state_target_repo,
+            self._prospect_repo,
+            self._state_repo,
+            self._school_repo
+        ]
+        return tuple(repo.data_version if repo is not None else 0 for repo in repositories)
+    
+    async def prefetch_all(self, names: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """
+        Load the collections used by query workflows into the repository caches.
+        
+        Args:
+            names: Repositories to load (e.g. "funder", "contribution"); all query
+                repositories when omitted
+        
+        Returns:
+            Dictionary mapping repository names to the number of entities loaded
+        """
+        repositories = {
+            "funder": self.funder_repository,
+            "contribution": self.contribution_repository,
+            "state": self.state_repository,
+            "state_target": self.state_target_repository,
+            "prospect": self.prospect_repository
+        }
+        if names is not None:
+            wanted = set(names)
+            repositories = {name: repo for name, repo in repositories.items() if name in wanted}
+        
+        results = await asyncio.gather(
+            *(repo.get_all() for repo in repositories.values()),
+            return_exceptions=True
+        )
+        
+        loaded = {}
+        for name, result in zip(repositories, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to prefetch {name} repository: {result}")
+                continue
+            loaded[name] = len(result)
+        
+        logger.debug(f"Prefetched repositories: {loaded}")
+        return loaded
+    
+    def start_prefetch(self, names: Optional[Iterable[str]] = None) -> Optional[asyncio.Task]:
+        """
+        Start prefetching in the background, reusing a prefetch already in flight.
+        
+        Args:
+            names: Repositories to load; all query repositories when omitted
+        
+        Returns:
+            Task that completes once the repository caches are warm, or None when
+            caching is disabled and a prefetch would only add extra sheet reads
+        """
+        if self.cache_ttl <= 0:
+            return None
+        if self._prefetch_task is None or self._prefetch_task.done():
+            self._prefetch_task = asyncio.create_task(self.prefetch_all(names))
+        return self._prefetch_task
+    
+    async def await_prefetch(self) -> None:
+        """Wait for a prefetch still in flight; never starts a new one."""
+        if self._prefetch_task is not None and not self._prefetch_task.done():
+            await self._prefetch_task
+    
     async def health_check_all(self) -> dict:
         """
         Perform health check on all repositories.
@@ -268,7 +348,7 @@ def get_repository_factory() -> RepositoryFactory:
 async def initialize_repository_factory(
     spreadsheet_id: Optional[str] = None,
     sheets_client: Optional[SheetsClient] = None,
-    cache_ttl: int = 300
+    cache_ttl: Optional[int] = None
 ) -> RepositoryFactory:
     """
     Initialize the global repository factory.
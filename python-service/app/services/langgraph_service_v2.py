@@ -5,15 +5,21 @@ Following the detailed agent steering documentation for true agentic workflows.
 """
 
 import logging
-from typing import Dict, Any, Optional
+import orjson
+from typing import AsyncIterator, Dict, Any, Optional
 from datetime import datetime
 
 from ..workflows.langgraph_agent import FundraisingAgent, get_fundraising_agent
-from ..repositories.repository_factory import RepositoryFactory
+from ..repositories.repository_factory import get_repository_factory
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps_log(record: Dict[str, Any]) -> str:
+    """Render a log record as compact JSON so it survives the plain message formatter"""
+    return orjson.dumps(record, default=str).decode()
+
+
 class LangGraphServiceV2:
     """
     LangGraph service completely rewritten following official patterns.
@@ -29,7 +35,9 @@ class LangGraphServiceV2:
     """
     
     def __init__(self):
-        self.repository_factory = RepositoryFactory()
+        # Share the process-wide factory so repository caches and the Sheets
+        # connection pool are reused by every service
+        self.repository_factory = get_repository_factory()
         self.agent: Optional[FundraisingAgent] = None
         self.is_initialized = False
     
@@ -47,6 +55,17 @@ class LangGraphServiceV2:
         except Exception as e:
             logger.error(f"❌ Failed to initialize LangGraph service: {e}")
             raise
+    
+    async def warm_up(self):
+        """Initialize the agent and warm its model client and data caches"""
+        if not self.is_initialized:
+            await self.initialize()
+        
+        try:
+            await self.agent.warm_up()
+        except Exception as e:
+            logger.error(f"❌ Failed to warm up LangGraph agent: {e}")
+    
     async def chat(self, message: str, session_id: str = None) -> Dict[str, Any]:
         """
         Process a chat message using the rewritten LangGraph agent.
@@ -65,15 +84,10 @@ class LangGraphServiceV2:
             # Process through the LangGraph agent - this is where agentic magic happens!
             result = await self.agent.process_query(message, session_id)
             
-            # Log the agentic flow verification
+            # Log the agentic flow verification as one structured record
             if result.get("success") and result.get("agentic_flow"):
                 flow = result["agentic_flow"]
-                logger.info(f"🎉 AGENTIC FLOW COMPLETED SUCCESSFULLY:")
-                logger.info(f"   📊 Steps Executed: {flow['steps_executed']}")
-                logger.info(f"   🔧 Tools Dynamically Selected: {flow['tools_used']}")
-                logger.info(f"   🧠 AI Reasoning: {flow['ai_reasoning']}")
-                logger.info(f"   🎯 Pattern Type: {flow.get('pattern_type', 'Dynamic')}")
-                logger.info(f"   ✅ Flow Confirmed: {flow['flow_confirmed']}")
+                logger.info(f"🎉 Agentic flow completed: {_dumps_log(flow)}")
             
             return result
             
@@ -84,6 +98,24 @@ class LangGraphServiceV2:
                 "error": str(e),
                 "session_id": session_id or "unknown"
             }
+    
+    async def chat_stream(self, message: str) -> AsyncIterator[str]:
+        """
+        Process a chat message, yielding response tokens as they are generated.
+        
+        Errors are logged and re-raised so the caller can end the stream.
+        """
+        if not self.is_initialized:
+            await self.initialize()
+        
+        try:
+            logger.info(f"🎯 Streaming chat message: {message[:100]}...")
+            async for token in self.agent.stream_response(message):
+                yield token
+        except Exception as e:
+            logger.error(f"❌ Error in streaming chat: {e}")
+            raise
+    
     async def get_status(self) -> Dict[str, Any]:
         """Get service status with agentic capabilities verification"""
         return {
@@ -145,11 +177,8 @@ class LangGraphServiceV2:
             
             result["agentic_verification"] = verification
             
-            # Log verification results
-            logger.info(f"🎉 AGENTIC VERIFICATION COMPLETED:")
-            logger.info(f"   🔧 Tools Used: {agentic_flow.get('tools_used', [])}")
-            logger.info(f"   📊 Steps: {agentic_flow.get('steps_executed', 0)}")
-            logger.info(f"   🧠 AI Decisions: {agentic_flow.get('flow_confirmed', False)}")
+            # Log verification results as one structured record
+            logger.info(f"🎉 Agentic verification completed: {_dumps_log(verification)}")
         
         return result
 
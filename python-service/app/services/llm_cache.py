@@ -0,0 +1,187 @@
+"""
+Response cache for deterministic LLM calls.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Chat model attributes that change the output for a given prompt
+_GENERATION_ATTRS = ("model", "temperature", "max_output_tokens", "max_tokens", "top_p", "top_k", "n")
+
+
+class LLMCacheEntry:
+    """Cached LLM response with expiration."""
+
+    def __init__(self, response: Any, ttl_seconds: int):
+        self.response = response
+        self.expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
+
+    def is_expired(self) -> bool:
+        return datetime.utcnow() > self.expires_at
+
+
+class LLMCache:
+    """
+    In-process LRU cache placed in front of `llm.ainvoke`.
+
+    Features:
+    - Exact-match lookup keyed by SHA-256 of (generation config, prompt)
+    - TTL expiry and LRU eviction
+    - Only low-temperature calls are cached so cached answers stay representative
+    - Identical calls made while one is in flight share its result (single-flight)
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        ttl_seconds: int = 600,
+        max_temperature: float = 0.1
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Time-to-live for cached responses
+            max_temperature: Calls above this temperature bypass the cache
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_temperature = max_temperature
+        self._entries: "OrderedDict[str, LLMCacheEntry]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    def is_cacheable(self, llm: Any) -> bool:
+        """Check whether calls to this LLM are deterministic enough to cache."""
+        if self.ttl_seconds <= 0 or self.max_entries <= 0:
+            return False
+        temperature = getattr(llm, "temperature", None)
+        return temperature is not None and temperature <= self.max_temperature
+
+    def make_key(self, llm: Any, messages: List[Any]) -> str:
+        """Build the cache key for an LLM call."""
+        payload = {attr: getattr(llm, attr, None) for attr in _GENERATION_ATTRS}
+        # Per-call arguments bound with llm.bind(...), e.g. a generation_config override
+        payload["bound"] = getattr(llm, "kwargs", None)
+        payload["prompt"] = [[getattr(m, "type", ""), getattr(m, "content", m)] for m in messages]
+        return hashlib.sha256(
+            json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        ).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get a cached response if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.is_expired():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry.response
+
+    def set(self, key: str, response: Any) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        self._entries[key] = LLMCacheEntry(response, self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def ainvoke(self, llm: Any, messages: List[Any]) -> Any:
+        """
+        Invoke the LLM, serving repeated prompts from the cache.
+
+        Args:
+            llm: LangChain chat model
+            messages: Messages to send
+
+        Returns:
+            The LLM response message
+        """
+        if not self.is_cacheable(llm):
+            return await llm.ainvoke(messages)
+
+        key = self.make_key(llm, messages)
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                self.hits += 1
+                logger.debug(f"LLM cache hit for {key[:12]}")
+                return cached
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                break
+
+            # Same prompt already on its way to the model; wait for that call
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    # This waiter itself was cancelled
+                    raise
+                # The leading call was cancelled, not us; retry, possibly as the new leader
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await llm.ainvoke(messages)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody waited on isn't logged as unhandled
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            self.set(key, response)
+            return response
+        finally:
+            del self._in_flight[key]
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        logger.info("Cleared LLM response cache")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits / total) if total else 0.0
+        }
+
+
+# Global cache instance
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get the global LLM response cache."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS
+        )
+    return _llm_cache
@@ -0,0 +1,52 @@
+"""
+Shared Gemini chat model clients.
+"""
+
+import logging
+from typing import Dict, Optional, Tuple
+
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+# Chat model clients keyed by (model, temperature, max_tokens)
+_llm_clients: Dict[Tuple[str, float, Optional[int]], ChatGoogleGenerativeAI] = {}
+
+
+def get_llm(
+    model: str = "gemini-1.5-pro",
+    temperature: float = 0.1,
+    max_tokens: Optional[int] = None
+) -> ChatGoogleGenerativeAI:
+    """
+    Get a shared chat model client, creating it on first use.
+
+    Nodes asking for the same configuration reuse one client and its
+    underlying connections instead of each opening their own.
+
+    Args:
+        model: Gemini model name
+        temperature: Sampling temperature
+        max_tokens: Optional output token limit
+
+    Returns:
+        ChatGoogleGenerativeAI instance
+    """
+    key = (model, temperature, max_tokens)
+    llm = _llm_clients.get(key)
+    if llm is None:
+        if not settings.GEMINI_API_KEY:
+            raise ValueError("GEMINI_API_KEY environment variable is required")
+
+        llm = ChatGoogleGenerativeAI(
+            model=model,
+            google_api_key=settings.GEMINI_API_KEY,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+        _llm_clients[key] = llm
+        logger.debug(f"Created LLM client for {model} (temperature={temperature}, max_tokens={max_tokens})")
+    return llm
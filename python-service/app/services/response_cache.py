@@ -0,0 +1,124 @@
+"""
+Cache of final answers for repeated standalone queries.
+"""
+
+import hashlib
+import logging
+import re
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import get_settings
+from app.services.llm_cache import LLMCacheEntry
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_NUMBER_WORDS = {
+    "one": "1", "two": "2", "three": "3", "four": "4", "five": "5",
+    "six": "6", "seven": "7", "eight": "8", "nine": "9", "ten": "10",
+    "fifteen": "15", "twenty": "20", "fifty": "50", "hundred": "100"
+}
+_NON_WORD_RE = re.compile(r"[^\w\s-]+")
+_NUMBER_WORD_RE = re.compile(r"\b(" + "|".join(_NUMBER_WORDS) + r")\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+class QueryResponseCache:
+    """
+    In-process LRU cache of workflow responses keyed by normalized query text.
+
+    Features:
+    - Case, punctuation, whitespace and small number-word differences map to one key
+    - Keys include the repository data version, so writes invalidate answers
+    - TTL expiry bounds staleness from edits made directly in the spreadsheet
+    """
+
+    def __init__(self, max_entries: int = 512, ttl_seconds: int = 300):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached responses
+            ttl_seconds: Time-to-live for cached responses
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, LLMCacheEntry]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything at all."""
+        return self.ttl_seconds > 0 and self.max_entries > 0
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        """Normalize a query so trivially different phrasings share a key."""
+        text = _NON_WORD_RE.sub(" ", query.lower())
+        text = _NUMBER_WORD_RE.sub(lambda m: _NUMBER_WORDS[m.group(1)], text)
+        return _WHITESPACE_RE.sub(" ", text).strip()
+
+    def make_key(self, query: str, data_version: Any) -> str:
+        """Build the cache key for a query against a data version."""
+        payload = f"{self.normalize_query(query)}|{data_version}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, query: str, data_version: Any) -> Optional[str]:
+        """Get the cached response for a query if present and not expired."""
+        if not self.enabled:
+            return None
+
+        key = self.make_key(query, data_version)
+        entry = self._entries.get(key)
+        if entry is None or entry.is_expired():
+            self._entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        logger.debug(f"Response cache hit for {key[:12]}")
+        return entry.response
+
+    def set(self, query: str, data_version: Any, response: str) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if not self.enabled:
+            return
+
+        key = self.make_key(query, data_version)
+        self._entries[key] = LLMCacheEntry(response, self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._entries.clear()
+        logger.info("Cleared query response cache")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / total) if total else 0.0
+        }
+
+
+# Global cache instance
+_response_cache: Optional[QueryResponseCache] = None
+
+
+def get_response_cache() -> QueryResponseCache:
+    """Get the global query response cache."""
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = QueryResponseCache(
+            max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS
+        )
+    return _response_cache
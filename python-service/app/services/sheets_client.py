@@ -59,36 +59,35 @@ class ConnectionPool:
         self.max_connections = max_connections
         self.connections: List[Any] = []
         self.in_use: set = set()
-        self._lock = asyncio.Lock()
+        # Signalled whenever a connection is released back to the pool
+        self._available = asyncio.Condition()
     
     async def get_connection(self, credentials: Credentials) -> Any:
         """Get a connection from the pool or create a new one."""
-        async with self._lock:
-            # Try to get an available connection
-            for conn in self.connections:
-                if id(conn) not in self.in_use:
+        async with self._available:
+            while True:
+                # Try to get an available connection
+                for conn in self.connections:
+                    if id(conn) not in self.in_use:
+                        self.in_use.add(id(conn))
+                        return conn
+                
+                # Create new connection if under limit
+                if len(self.connections) < self.max_connections:
+                    conn = build('sheets', 'v4', credentials=credentials)
+                    self.connections.append(conn)
                     self.in_use.add(id(conn))
                     return conn
-            
-            # Create new connection if under limit
-            if len(self.connections) < self.max_connections:
-                conn = build('sheets', 'v4', credentials=credentials)
-                self.connections.append(conn)
-                self.in_use.add(id(conn))
-                return conn
-            
-            # Wait for a connection to become available
-            while len(self.in_use) >= self.max_connections:
-                await asyncio.sleep(0.1)
-            
-            # Try again
-            return await self.get_connection(credentials)
+                
+                # Wait for a connection to be released
+                await self._available.wait()
     
     async def release_connection(self, connection: Any):
         """Release a connection back to the pool."""
-        async with self._lock:
+        async with self._available:
             if id(connection) in self.in_use:
                 self.in_use.remove(id(connection))
+                self._available.notify()
 
 
 class SheetsClient:
@@ -206,9 +205,9 @@ class SheetsClient:
                     # Authentication error - try to refresh credentials
                     self.credentials = None
                     raise SheetsAuthError(f"Authentication failed: {e}")
-                elif error_code == 403:
-                    # Rate limit or permission error
-                    if "quota" in str(e).lower() or "rate" in str(e).lower():
+                elif error_code in (403, 429):
+                    # Rate limit or permission error; 429 is always a rate limit
+                    if error_code == 429 or "quota" in str(e).lower() or "rate" in str(e).lower():
                         if attempt < self.retry_config.max_retries:
                             delay = self._calculate_delay(attempt)
                             logger.warning(f"Rate limit hit, retrying in {delay}s (attempt {attempt + 1})")
@@ -266,6 +265,15 @@ class SheetsClient:
         """Release a service instance back to the connection pool."""
         await self.connection_pool.release_connection(service)
     
+    async def _run_request(self, request) -> Any:
+        """
+        Execute an API request in a worker thread so the event loop keeps running.
+        
+        googleapiclient requests block on HTTP. Each pooled service is used by one
+        operation at a time, so concurrent requests never share an HTTP client.
+        """
+        return await asyncio.to_thread(request.execute)
+    
     async def read_range(
         self, 
         spreadsheet_id: str, 
@@ -286,11 +294,11 @@ class SheetsClient:
         async def _read_operation():
             service = await self._get_service()
             try:
-                result = service.spreadsheets().values().get(
+                result = await self._run_request(service.spreadsheets().values().get(
                     spreadsheetId=spreadsheet_id,
                     range=range_name,
                     valueRenderOption=value_render_option
-                ).execute()
+                ))
                 
                 values = result.get('values', [])
                 logger.debug(f"Read {len(values)} rows from {range_name}")
@@ -328,12 +336,12 @@ class SheetsClient:
                     'majorDimension': 'ROWS'
                 }
                 
-                result = service.spreadsheets().values().update(
+                result = await self._run_request(service.spreadsheets().values().update(
                     spreadsheetId=spreadsheet_id,
                     range=range_name,
                     valueInputOption=value_input_option,
                     body=body
-                ).execute()
+                ))
                 
                 logger.debug(f"Wrote {len(values)} rows to {range_name}")
                 return result
@@ -370,13 +378,13 @@ class SheetsClient:
                     'majorDimension': 'ROWS'
                 }
                 
-                result = service.spreadsheets().values().append(
+                result = await self._run_request(service.spreadsheets().values().append(
                     spreadsheetId=spreadsheet_id,
                     range=range_name,
                     valueInputOption=value_input_option,
                     insertDataOption='INSERT_ROWS',
                     body=body
-                ).execute()
+                ))
                 
                 logger.debug(f"Appended {len(values)} rows to {range_name}")
                 return result
@@ -404,10 +412,10 @@ class SheetsClient:
         async def _clear_operation():
             service = await self._get_service()
             try:
-                result = service.spreadsheets().values().clear(
+                result = await self._run_request(service.spreadsheets().values().clear(
                     spreadsheetId=spreadsheet_id,
                     range=range_name
-                ).execute()
+                ))
                 
                 logger.debug(f"Cleared range {range_name}")
                 return result
@@ -437,10 +445,10 @@ class SheetsClient:
             try:
                 body = {'requests': requests}
                 
-                result = service.spreadsheets().batchUpdate(
+                result = await self._run_request(service.spreadsheets().batchUpdate(
                     spreadsheetId=spreadsheet_id,
                     body=body
-                ).execute()
+                ))
                 
                 logger.debug(f"Executed batch update with {len(requests)} requests")
                 return result
@@ -466,10 +474,10 @@ class SheetsClient:
         async def _metadata_operation():
             service = await self._get_service()
             try:
-                result = service.spreadsheets().get(
+                result = await self._run_request(service.spreadsheets().get(
                     spreadsheetId=spreadsheet_id,
                     includeGridData=False
-                ).execute()
+                ))
                 
                 logger.debug(f"Retrieved metadata for spreadsheet {spreadsheet_id}")
                 return result
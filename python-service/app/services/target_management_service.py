@@ -2,13 +2,14 @@
 Service for managing state targets with automatic previous year funding defaults.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from app.models.entities import StateTargetModel, ContributionStatus
-from app.repositories.repository_factory import RepositoryFactory
+from app.repositories.repository_factory import RepositoryFactory, get_repository_factory
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ class TargetManagementService:
     """Service for managing state targets with intelligent defaults."""
     
     def __init__(self, repository_factory: RepositoryFactory = None):
-        self.repository_factory = repository_factory or RepositoryFactory()
+        self.repository_factory = repository_factory or get_repository_factory()
         self.state_target_repo = self.repository_factory.state_target_repository
         self.contribution_repo = self.repository_factory.contribution_repository
         self.state_repo = self.repository_factory.state_repository
@@ -254,8 +255,12 @@ class TargetManagementService:
         try:
             logger.info(f"Generating target vs actual comparison for {fiscal_year}")
             
-            # Get all targets for the fiscal year
-            targets = await self.state_target_repo.find_by_fiscal_year(fiscal_year)
+            # Load the targets and warm the contributions cache concurrently; the
+            # per-state totals below are then served from the cached contributions
+            targets, _ = await asyncio.gather(
+                self.state_target_repo.find_by_fiscal_year(fiscal_year),
+                self.contribution_repo.get_all()
+            )
             
             results = {}
             
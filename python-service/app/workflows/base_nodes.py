@@ -6,7 +6,9 @@ Provides foundational node types for building complex workflows.
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional, Union, Callable
 from datetime import datetime
+import functools
 import logging
+import time
 import uuid
 
 from ..models.workflow import AgentState, CRUDState, ChatMessage, MessageRole
@@ -56,6 +58,36 @@ class BaseWorkflowNode(ABC):
         else:
             logger.info(message, extra=log_data)
     
+    def timed(self, fn: Optional[Callable] = None) -> Callable:
+        """
+        Wrap a node callable so its wall-clock time, awaits included, is recorded.
+        
+        Durations accumulate in state.metadata["node_timings_ms"] under the node
+        name, which shows where a request spends its time even when the node is
+        idle waiting on the LLM or the Sheets API.
+        
+        Args:
+            fn: Async callable taking the state; defaults to execute
+            
+        Returns:
+            Async callable suitable for StateGraph.add_node
+        """
+        fn = fn or self.execute
+        label = self.name if fn.__name__ == "execute" else f"{self.name}.{fn.__name__}"
+        
+        @functools.wraps(fn)
+        async def wrapper(state):
+            start = time.perf_counter_ns()
+            result = await fn(state)
+            elapsed_ms = (time.perf_counter_ns() - start) / 1_000_000
+            
+            timings = result.metadata.setdefault("node_timings_ms", {})
+            timings[label] = round(timings.get(label, 0.0) + elapsed_ms, 3)
+            logger.debug(f"Node {label} took {elapsed_ms:.1f}ms")
+            return result
+        
+        return wrapper
+    
     def update_state_metadata(self, state: Union[AgentState, CRUDState], key: str, value: Any):
         """Update state metadata with node information"""
         if not hasattr(state, 'metadata'):
@@ -7,11 +7,9 @@ from typing import Any, Dict, List, Optional, Union
 from datetime import datetime
 import logging
 import json
-import os
 import uuid
 
 from langgraph.graph import StateGraph, START, END
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage
 from langchain_core.tools import tool
 
@@ -19,6 +17,7 @@ from ..models.workflow import (
     CRUDState, CRUDOperation, ValidationResult, ValidationSeverity, AuditEntry
 )
 from ..repositories.repository_factory import RepositoryFactory
+from ..services.llm_client import get_llm
 from .base_nodes import BaseWorkflowNode
 from .engine import BaseWorkflow
 
@@ -33,16 +32,7 @@ class AIValidationNode(BaseWorkflowNode):
     def __init__(self):
         super().__init__("ai_validator", "AI-powered data validation")
         
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
-        
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
-            google_api_key=api_key,
-            temperature=0.1,
-            max_tokens=1024
-        )
+        self.llm = get_llm(temperature=0.1, max_tokens=1024)
         
         # Business rules for different entity types
         self.business_rules = {
@@ -56,11 +56,22 @@ class WorkflowEngine:
             **kwargs: Additional arguments for workflow initialization
         """
         try:
+            # Re-registering the same workflow keeps its instance and compiled graph
+            existing = self.workflow_definitions.get(name)
+            if (
+                existing is not None
+                and existing["class"] is workflow_class
+                and existing["kwargs"].keys() == kwargs.keys()
+                and all(existing["kwargs"][key] is value for key, value in kwargs.items())
+            ):
+                logger.debug(f"Workflow '{name}' already registered; reusing compiled graph")
+                return
+            
             # Create workflow instance
             workflow_instance = workflow_class(**kwargs)
             
             # Build the workflow graph
-            compiled_workflow = workflow_instance.create_workflow()
+            compiled_workflow = workflow_instance.get_compiled_workflow()
             
             # Store workflow
             self.workflows[name] = compiled_workflow
@@ -304,6 +315,9 @@ class BaseWorkflow:
         self.edges: List[Dict[str, Any]] = []
         self.conditional_edges: List[Dict[str, Any]] = []
         
+        # Compiled graph, built once and reused for every execution
+        self._compiled_workflow: Optional[Any] = None
+        
     def add_node(self, node: BaseWorkflowNode) -> None:
         """Add a node to the workflow"""
         self.nodes[node.name] = node
@@ -333,6 +347,15 @@ class BaseWorkflow:
         """
         raise NotImplementedError("Subclasses must implement create_workflow method")
     
+    def get_compiled_workflow(self) -> Any:
+        """
+        Get the compiled LangGraph workflow, compiling it on first use.
+        Nodes keep no per-request data, so one compiled graph serves all executions.
+        """
+        if self._compiled_workflow is None:
+            self._compiled_workflow = self.create_workflow()
+        return self._compiled_workflow
+    
     async def execute_node(self, node_name: str, state: Union[AgentState, CRUDState]) -> Union[AgentState, CRUDState]:
         """Execute a specific node"""
         if node_name not in self.nodes:
@@ -7,20 +7,26 @@ for proper agentic workflows with dynamic tool selection and multi-step reasonin
 """
 
 import json
-import os
-from typing import Annotated, Dict, List, Any, Optional, TypedDict
+from decimal import Decimal
+from enum import Enum
+from typing import Annotated, AsyncIterator, Dict, List, Any, Optional, Tuple, TypedDict
 from datetime import datetime
 import logging
-import asyncio
+import re
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.message import add_messages
 from langgraph.prebuilt import ToolNode, tools_condition
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage, ToolMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, AIMessageChunk, SystemMessage, ToolMessage
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.tools import tool
-from langchain_google_genai import ChatGoogleGenerativeAI
 
+from pydantic import BaseModel
+
+from ..models.entities import ContributionModel, FunderModel
 from ..repositories.repository_factory import RepositoryFactory
+from ..repositories.repository_factory import get_repository_factory as get_shared_repository_factory
+from ..services.llm_client import get_llm
 
 logger = logging.getLogger(__name__)
 
@@ -45,12 +51,92 @@ def get_repository_factory() -> RepositoryFactory:
     """Get the global repository factory"""
     global _repository_factory
     if _repository_factory is None:
-        _repository_factory = RepositoryFactory()
+        _repository_factory = get_shared_repository_factory()
     return _repository_factory
 
+def _llm_fields(model: type, excluded: frozenset) -> List[str]:
+    """Model fields sent to the LLM, in declaration order, minus the excluded ones"""
+    unknown = excluded - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {sorted(unknown)}")
+    return [name for name in model.model_fields if name not in excluded]
+
+
+# Fields sent back to the LLM for each record type. Tool outputs are serialized
+# into the conversation, so only bookkeeping fields that never answer a user
+# question (ID lists, free-form metadata, row timestamps) are left out.
+LLM_FIELD_WHITELIST: Dict[str, List[str]] = {
+    "funder": _llm_fields(FunderModel, frozenset({"contribution_history", "created_at", "updated_at"})),
+    "contribution": _llm_fields(ContributionModel, frozenset({"metadata", "created_at", "updated_at"}))
+}
+
+# Filter keys with custom matching logic in each tool
+FUNDER_PREDICATE_FILTERS = frozenset({"name_contains", "state", "min_amount"})
+CONTRIBUTION_PREDICATE_FILTERS = frozenset({"funder_name_contains", "year_range"})
+
+
+def _llm_value(value: Any) -> Any:
+    """Coerce a field value to a JSON-native type for tool output"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, BaseModel):
+        return value.model_dump(exclude_none=True)
+    return value
+
+
+def _project_records(records: List[Dict[str, Any]], record_type: str) -> List[Dict[str, Any]]:
+    """Project records to the whitelisted fields, coercing values to JSON-native types"""
+    fields = LLM_FIELD_WHITELIST[record_type]
+    return [
+        {key: _llm_value(record[key]) for key in fields if key in record}
+        for record in records
+    ]
+
+
+def _project_entities(entities: List[Any], record_type: str) -> List[Dict[str, Any]]:
+    """Project model instances to the whitelisted fields without building full record dicts"""
+    fields = LLM_FIELD_WHITELIST[record_type]
+    return [{key: _llm_value(getattr(entity, key)) for key in fields} for entity in entities]
+
+def _contains_pattern(text: Any) -> "re.Pattern[str]":
+    """Case-insensitive substring matcher, compiled once per tool call instead of lowercasing every row"""
+    return re.compile(re.escape(str(text)), re.IGNORECASE)
+
+
+def _split_filters(
+    filters: Dict[str, Any],
+    predicate_keys: frozenset,
+    records: List[Dict[str, Any]]
+) -> Tuple[frozenset, Dict[str, Any]]:
+    """
+    Separate plain equality filters from the ones needing custom predicates.
+    
+    Equality filters on fields the records actually have are returned as a frozenset
+    of items, so a record matches when `record.items() >= equality_items` - a single
+    subset test done in C. Everything else (predicate keys, unknown fields and
+    unhashable values) is returned for the per-record loop.
+    """
+    record_keys = records[0].keys() if records else {}
+    equality = {}
+    remaining = {}
+    for key, value in filters.items():
+        if key not in predicate_keys and key in record_keys:
+            try:
+                hash(value)
+                equality[key] = value
+                continue
+            except TypeError:
+                pass
+        remaining[key] = value
+    return frozenset(equality.items()), remaining
+
 # Define tools as standalone functions following LangGraph patterns
 @tool
-def get_funders_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+async def get_funders_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Fetch funder data from Google Sheets.
     
@@ -67,30 +153,25 @@ def get_funders_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str,
         repo_factory = get_repository_factory()
         funder_repo = repo_factory.funder_repository
         
-        # Run async method in sync context
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        funders = loop.run_until_complete(funder_repo.get_all())
-        
-        # Convert to dict format
-        funder_data = []
-        for funder in funders:
-            funder_dict = funder.to_dict() if hasattr(funder, 'to_dict') else funder.__dict__
-            funder_data.append(funder_dict)
+        # Async tool: runs on the graph's event loop, sharing the repository caches,
+        # in-flight loads and Sheets connection pool with the rest of the service
+        funders = await funder_repo.get_all()
         
         # Apply filters if provided
         if filters:
+            funder_data = [funder.to_dict() for funder in funders]
+            equality_items, predicate_filters = _split_filters(filters, FUNDER_PREDICATE_FILTERS, funder_data)
+            candidates = [f for f in funder_data if f.items() >= equality_items] if equality_items else funder_data
+            if "name_contains" in predicate_filters:
+                predicate_filters["name_contains"] = _contains_pattern(predicate_filters["name_contains"])
+            
             filtered_funders = []
-            for funder in funder_data:
+            for funder in candidates:
                 matches = True
                 
                 # Handle different filter types
-                for key, value in filters.items():
-                    if key == "name_contains" and value.lower() not in funder.get("name", "").lower():
+                for key, value in predicate_filters.items():
+                    if key == "name_contains" and not value.search(funder.get("name") or ""):
                         matches = False
                         break
                     elif key == "state" and funder.get("state") != value:
@@ -107,16 +188,17 @@ def get_funders_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str,
                     filtered_funders.append(funder)
             
             logger.info(f"✅ Tool result: Filtered {len(funder_data)} funders to {len(filtered_funders)} results")
-            return filtered_funders
+            return _project_records(filtered_funders, "funder")
         
-        logger.info(f"✅ Tool result: Retrieved {len(funder_data)} funders from Google Sheets")
-        return funder_data
+        # Without filters only the whitelisted fields are read, straight off the models
+        logger.info(f"✅ Tool result: Retrieved {len(funders)} funders from Google Sheets")
+        return _project_entities(funders, "funder")
         
     except Exception as e:
         logger.error(f"❌ Tool error: Error fetching funders from Google Sheets: {e}")
         return []
 @tool
-def get_contributions_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+async def get_contributions_data(filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
     """
     Fetch contribution data from Google Sheets.
     
@@ -133,33 +215,25 @@ def get_contributions_data(filters: Optional[Dict[str, Any]] = None) -> List[Dic
         repo_factory = get_repository_factory()
         contribution_repo = repo_factory.contribution_repository
         
-        # Run async method in sync context
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        contributions = loop.run_until_complete(contribution_repo.get_all())
-        
-        # Convert to dict format
-        contribution_data = []
-        for contribution in contributions:
-            contrib_dict = contribution.to_dict() if hasattr(contribution, 'to_dict') else contribution.__dict__
-            contribution_data.append(contrib_dict)
+        contributions = await contribution_repo.get_all()
         
         # Apply filters if provided
         if filters:
+            contribution_data = [contribution.to_dict() for contribution in contributions]
+            equality_items, predicate_filters = _split_filters(filters, CONTRIBUTION_PREDICATE_FILTERS, contribution_data)
+            candidates = [c for c in contribution_data if c.items() >= equality_items] if equality_items else contribution_data
+            if "funder_name_contains" in predicate_filters:
+                predicate_filters["funder_name_contains"] = _contains_pattern(predicate_filters["funder_name_contains"])
+            
             filtered_contributions = []
-            for contrib in contribution_data:
+            for contrib in candidates:
                 matches = True
                 
                 # Handle different filter types
-                for key, value in filters.items():
+                for key, value in predicate_filters.items():
                     if key == "funder_name_contains":
                         # Check if funder name contains the value (case insensitive)
-                        funder_name = contrib.get("funder_name", "")
-                        if value.lower() not in funder_name.lower():
+                        if not value.search(contrib.get("funder_name") or ""):
                             matches = False
                             break
                     elif key == "year_range":
@@ -182,10 +256,11 @@ def get_contributions_data(filters: Optional[Dict[str, Any]] = None) -> List[Dic
                     filtered_contributions.append(contrib)
             
             logger.info(f"✅ Tool result: Filtered {len(contribution_data)} contributions to {len(filtered_contributions)} results")
-            return filtered_contributions
+            return _project_records(filtered_contributions, "contribution")
         
-        logger.info(f"✅ Tool result: Retrieved {len(contribution_data)} contributions from Google Sheets")
-        return contribution_data
+        # Without filters only the whitelisted fields are read, straight off the models
+        logger.info(f"✅ Tool result: Retrieved {len(contributions)} contributions from Google Sheets")
+        return _project_entities(contributions, "contribution")
         
     except Exception as e:
         logger.error(f"❌ Tool error: Error fetching contributions from Google Sheets: {e}")
@@ -255,9 +330,35 @@ def calculate_metrics(data: List[Dict[str, Any]], metric_type: str) -> Dict[str,
         return {"error": str(e)}
 
 
+# Chat model settings for the agent; warm_up uses the same client
+AGENT_LLM_CONFIG = {"model": "gemini-1.5-flash", "temperature": 0.1, "max_tokens": 2048}
+
 # Create the list of available tools
 tools = [get_funders_data, get_contributions_data, calculate_metrics]
 
+# System message for fundraising context, built once and shared by every turn
+SYSTEM_MESSAGE = SystemMessage(content="""You are an intelligent AI assistant for a fundraising intelligence platform. 
+
+You help users analyze fundraising data, answer questions about funders and contributions, and provide actionable insights.
+
+Available tools:
+- get_funders_data: Fetch funder information with optional filters like state, name_contains, min_amount
+- get_contributions_data: Fetch contribution records with optional filters like state_code, fiscal_year, funder_name_contains  
+- calculate_metrics: Calculate various metrics (sum, top_n, count) from data
+
+When a user asks a question:
+1. Think about what data you need to answer their question
+2. Use the appropriate tools to fetch that data with relevant filters
+3. Analyze the data to extract insights
+4. Provide a comprehensive, data-driven response with specific numbers
+
+Always use actual data from the tools to support your answers. Be specific with numbers and provide actionable recommendations when appropriate.
+
+Examples of good tool usage:
+- For "top funders in California": use get_funders_data({"state": "CA"}) then calculate_metrics(data, "top_n")
+- For "Microsoft contributions": use get_contributions_data({"funder_name_contains": "Microsoft"})
+- For "total contributions by state": use get_contributions_data() then calculate_metrics(data, "sum")""")
+
 
 def create_fundraising_agent(repository_factory: RepositoryFactory):
     """
@@ -269,56 +370,32 @@ def create_fundraising_agent(repository_factory: RepositoryFactory):
     set_repository_factory(repository_factory)
     
     # Step 2: Initialize LLM with tool support
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        raise ValueError("GEMINI_API_KEY environment variable is required")
-    
-    llm = ChatGoogleGenerativeAI(
-        model="gemini-1.5-flash",
-        google_api_key=api_key,
-        temperature=0.1,
-        max_tokens=2048
-    )
+    llm = get_llm(**AGENT_LLM_CONFIG)
     
     # Step 3: Bind tools to LLM (tells the LLM how to call tools in JSON)
     llm_with_tools = llm.bind_tools(tools)
     
+    # Prepend the system message via a prompt template so LangChain assembles
+    # the final message list instead of user-space list concatenation
+    prompt = ChatPromptTemplate.from_messages([
+        SYSTEM_MESSAGE,
+        MessagesPlaceholder("messages")
+    ])
+    agent_runnable = prompt | llm_with_tools
+    
     # Step 4: Create a StateGraph
     graph_builder = StateGraph(State)
     
     # Step 5: Add nodes
-    def chatbot(state: State):
+    async def chatbot(state: State):
         """
         Chatbot node that processes messages and decides whether to use tools.
         This is where the AI makes dynamic decisions about tool usage.
         """
-        # Create system message for fundraising context
-        system_message = SystemMessage(content="""You are an intelligent AI assistant for a fundraising intelligence platform. 
-
-You help users analyze fundraising data, answer questions about funders and contributions, and provide actionable insights.
-
-Available tools:
-- get_funders_data: Fetch funder information with optional filters like state, name_contains, min_amount
-- get_contributions_data: Fetch contribution records with optional filters like state_code, fiscal_year, funder_name_contains  
-- calculate_metrics: Calculate various metrics (sum, top_n, count) from data
-
-When a user asks a question:
-1. Think about what data you need to answer their question
-2. Use the appropriate tools to fetch that data with relevant filters
-3. Analyze the data to extract insights
-4. Provide a comprehensive, data-driven response with specific numbers
-
-Always use actual data from the tools to support your answers. Be specific with numbers and provide actionable recommendations when appropriate.
-
-Examples of good tool usage:
-- For "top funders in California": use get_funders_data({"state": "CA"}) then calculate_metrics(data, "top_n")
-- For "Microsoft contributions": use get_contributions_data({"funder_name_contains": "Microsoft"})
-- For "total contributions by state": use get_contributions_data() then calculate_metrics(data, "sum")""")
-        
-        messages = [system_message] + state["messages"]
-        
-        # Call the model - this is where AI decides what tools to use
-        response = llm_with_tools.invoke(messages)
+        # Prompt assembly is delegated to the template; the message history is
+        # handed over as-is instead of being copied into a new list every turn.
+        # Under stream_mode="messages" the model streams and tokens reach the caller live
+        response = await agent_runnable.ainvoke({"messages": state["messages"]})
         
         # Log AI decision making
         if hasattr(response, 'tool_calls') and response.tool_calls:
@@ -366,17 +443,36 @@ class FundraisingAgent:
         self.graph = create_fundraising_agent(repository_factory)
         
         logger.info("🎯 FundraisingAgent initialized with proper LangGraph patterns")
-    def stream_graph_updates(self, user_input: str):
+    
+    async def warm_up(self) -> None:
+        """
+        Pay cold-start costs before the first user request.
+        
+        Sends a tiny prompt through the agent's shared Gemini client so its
+        connection is established, and starts loading the spreadsheet data
+        into the repository caches.
         """
-        Stream graph updates for real-time feedback following official patterns.
-        This demonstrates the agentic flow with live updates.
+        self.repository_factory.start_prefetch()
+        # Same shared client, capped at one output token for the ping only
+        ping_llm = get_llm(**AGENT_LLM_CONFIG).bind(generation_config={"max_output_tokens": 1})
+        await ping_llm.ainvoke([HumanMessage(content="ping")])
+        await self.repository_factory.await_prefetch()
+        logger.info("🔥 FundraisingAgent warmed up")
+    
+    async def stream_response(self, query: str) -> AsyncIterator[str]:
+        """
+        Stream the agent's answer token by token as Gemini generates it.
+        
+        Tool-calling turns are run as usual but not forwarded; only text the
+        chatbot node produces for the user is yielded.
         """
-        for event in self.graph.stream({"messages": [HumanMessage(content=user_input)]}):
-            for value in event.values():
-                if "messages" in value and value["messages"]:
-                    last_message = value["messages"][-1]
-                    if hasattr(last_message, 'content') and last_message.content:
-                        yield f"Assistant: {last_message.content}"
+        initial_state = {"messages": [HumanMessage(content=query)]}
+        
+        async for chunk, metadata in self.graph.astream(initial_state, stream_mode="messages"):
+            if metadata.get("langgraph_node") != "chatbot":
+                continue
+            if isinstance(chunk, AIMessageChunk) and chunk.content and not chunk.tool_call_chunks:
+                yield chunk.content
     
     async def process_query(self, query: str, session_id: str = None) -> Dict[str, Any]:
         """
@@ -402,7 +498,7 @@ class FundraisingAgent:
             step_count = 0
             tools_used = []
             
-            for step in self.graph.stream(initial_state):
+            async for step in self.graph.astream(initial_state):
                 step_count += 1
                 logger.info(f"📊 Step {step_count}: {list(step.keys())}")
                 final_state = step
@@ -502,7 +598,7 @@ def get_fundraising_agent(repository_factory: RepositoryFactory = None) -> Fundr
     global _fundraising_agent
     if _fundraising_agent is None:
         if repository_factory is None:
-            repository_factory = RepositoryFactory()
+            repository_factory = get_shared_repository_factory()
         _fundraising_agent = FundraisingAgent(repository_factory)
         logger.info("✅ Global FundraisingAgent instance created")
     return _fundraising_agent
@@ -3,27 +3,335 @@ AI Agent workflow using Gemini AI for intelligent query processing.
 Implements true agentic behavior with dynamic reasoning, tool selection, and multi-step conversations.
 """
 
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime
+from decimal import Decimal
+import heapq
 import logging
 import asyncio
-import json
-import os
+import dataclasses
+import re
 
+import orjson
+from pydantic import BaseModel
 from langgraph.graph import StateGraph, START, END
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, AIMessage, SystemMessage
-from langchain_core.tools import tool
+from langchain_core.tools import BaseTool, tool
 from langchain_core.prompts import ChatPromptTemplate
 
+from ..core.config import get_settings
+from ..models.entities import ContributionStatus
 from ..models.workflow import (
     AgentState, ChatMessage, MessageRole, AnalysisResult, AnalysisType, DataContext
 )
 from ..repositories.repository_factory import RepositoryFactory
+from ..services.llm_cache import get_llm_cache
+from ..services.llm_client import get_llm
+from ..services.response_cache import get_response_cache
 from .base_nodes import BaseWorkflowNode
 from .engine import BaseWorkflow
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_NUMERIC_TYPES = (int, float, Decimal)
+
+# Simple queries answered by FastPathNode without calling the LLM
+_TOP_FUNDERS_RE = re.compile(
+    r"^(?:(?:show|list|who are|what are)\s+(?:me\s+)?)?(?:the\s+)?"
+    r"top\s+(\d{1,3})\s+funders\s*\??$",
+    re.IGNORECASE
+)
+_TOTAL_CONTRIBUTIONS_RE = re.compile(
+    r"^(?:what(?:'s|\s+is|\s+are)\s+(?:the\s+)?)?total\s+(?:of\s+all\s+)?contributions"
+    r"(?:\s+in\s+([A-Za-z]{2}))?(?:\s+(?:for|in)\s+(?:fy\s*)?(\d{4}-\d{2}))?\s*\??$",
+    re.IGNORECASE
+)
+
+# Query keywords hinting which repositories a plan will read, used to prefetch
+# only those while the model is reasoning
+_REPOSITORY_HINTS = (
+    (re.compile(r"\b(?:funders?|donors?|contacts?)\b", re.IGNORECASE), ("funder",)),
+    (re.compile(r"contribut|donat|raised|\bgave\b|\btotal\b|\btop\b", re.IGNORECASE), ("contribution", "funder")),
+    (re.compile(r"\b(?:targets?|goals?|progress)\b", re.IGNORECASE), ("state_target", "state")),
+    (re.compile(r"\bprospects?\b|pipeline", re.IGNORECASE), ("prospect",)),
+    (re.compile(r"\bstates?\b|\bregions?\b", re.IGNORECASE), ("state",))
+)
+
+# Statuses counted toward totals, matching ContributionRepository.get_total_by_state
+_COUNTED_CONTRIBUTION_STATUSES = frozenset({ContributionStatus.CONFIRMED, ContributionStatus.RECEIVED})
+
+# Trivial or disallowed queries answered by PreflightNode with a canned reply
+_GREETING_RE = re.compile(
+    r"^(?:hi|hello|hey|hiya|good\s+(?:morning|afternoon|evening)|thanks|thank\s+you|thx|ok(?:ay)?)"
+    r"(?:\s+there)?[\s!.?]*$",
+    re.IGNORECASE
+)
+_DENYLIST_RE = re.compile(
+    r"\b(?:ignore|disregard|forget)\s+(?:all\s+|any\s+)?(?:previous|prior|above|your)\s+instructions\b"
+    r"|\b(?:reveal|show|print|repeat)\s+(?:me\s+)?(?:your|the)\s+system\s+prompt\b",
+    re.IGNORECASE
+)
+GREETING_RESPONSE = (
+    "Hi! I can help you explore your fundraising data. Try asking about top funders, "
+    "contributions by state or fiscal year, or progress against state targets."
+)
+REFUSAL_RESPONSE = (
+    "I can only help with questions about your fundraising data, such as funders, "
+    "contributions, prospects and state targets."
+)
+EMPTY_QUERY_RESPONSE = "Please enter a question about your fundraising data."
+
+# Answers rendered without the LLM when the analysis result is a plain number or ranking
+TOTAL_ANSWER_TEMPLATE = (
+    "The total confirmed and received contribution amount is ${total:,.2f} "
+    "across {records:,} contribution records."
+)
+TOP_N_ANSWER_TEMPLATE = "Top {count} confirmed and received contributions by amount:\n{lines}"
+TOP_N_LINE_TEMPLATE = "{rank}. {name}: ${amount:,.2f}"
+
+# Markdown code fences Gemini tends to wrap JSON answers in
+_JSON_FENCE_RE = re.compile(r"^```(?:json)?\s*|\s*```$", re.IGNORECASE)
+
+# Number of latest conversation messages passed to the reasoning prompt verbatim
+RECENT_MESSAGE_COUNT = 2
+
+# Sessions whose background rolling-summary update is kept until their next turn
+MAX_PENDING_SUMMARIES = 256
+
+# Conversation context shown to the response prompt: last N user/assistant turns,
+# each clipped so long analysis replies don't bloat the prompt
+CONTEXT_MESSAGE_COUNT = 3
+CONTEXT_MESSAGE_MAX_CHARS = 512
+_CONTEXT_ROLES = (MessageRole.USER, MessageRole.ASSISTANT)
+_CODE_BLOCK_RE = re.compile(r"```.*?```", re.DOTALL)
+
+# Keywords in the reasoning plan that select the next action, in priority order
+_PLAN_ACTIONS = [
+    ("fetch_data", ["fetch", "get", "retrieve", "data"]),
+    ("analyze_data", ["calculate", "analyze", "compute", "metrics"]),
+    ("ask_clarification", ["clarify", "unclear", "need more", "question"]),
+]
+_WORKFLOW_ACTIONS = frozenset(
+    [action for action, _ in _PLAN_ACTIONS] + ["generate_response"]
+)
+_PLAN_KEYWORD_RANK = {
+    keyword: rank
+    for rank, (_, keywords) in enumerate(_PLAN_ACTIONS)
+    for keyword in keywords
+}
+_PLAN_KEYWORD_RE = re.compile(
+    "|".join(re.escape(keyword) for keyword in _PLAN_KEYWORD_RANK),
+    re.IGNORECASE
+)
+
+
+# Static instructions for the reasoning node. Kept byte-identical across calls
+# and sent ahead of the per-query context so provider-side prefix caching applies.
+REASONING_SYSTEM_MESSAGE = SystemMessage(content="""You are an intelligent AI agent for a fundraising intelligence platform. You are designed to think step-by-step and create detailed plans to answer user queries.
+
+AVAILABLE TOOLS:
+- get_funders_data(filters): Fetch funder information with optional filters
+- get_contributions_data(filters): Fetch contribution records with optional filters
+- get_states_data(filters): Fetch state information with optional filters  
+- get_state_targets_data(filters): Fetch state target data with optional filters
+- get_prospects_data(filters): Fetch prospect information with optional filters
+- calculate_metrics(data, metric_type): Calculate metrics (sum, average, count, top_n, trend)
+
+YOUR REASONING PROCESS:
+1. **UNDERSTAND**: Analyze the user's question - what exactly are they asking?
+2. **PLAN**: Create a step-by-step plan to answer their question
+3. **DATA STRATEGY**: Determine what specific data you need and why
+4. **ANALYSIS STRATEGY**: Plan what calculations/analysis will provide the answer
+5. **RESPONSE STRATEGY**: Plan how to present the findings clearly
+
+AVAILABLE DATA SOURCES:
+- funders: Contains funder information (name, contact, location, etc.)
+- contributions: Contains donation records (amount, date, funder_id, state_code, fiscal_year)
+- states: Contains state information (name, code, region, etc.)
+- state_targets: Contains fundraising targets by state and fiscal year
+- prospects: Contains potential donor information (stage, potential_amount, etc.)
+
+TASK: For the context and query that follow, create a detailed reasoning plan that explains:
+1. What the user is asking for (be specific)
+2. What data you need to fetch and why
+3. What analysis you'll perform on that data
+4. How this will answer their question
+5. Any potential challenges or limitations
+
+Think step-by-step and be thorough in your reasoning. Your plan will guide the next steps in the workflow.
+
+Respond with a single JSON object and nothing else:
+{
+    "reasoning": "Your step-by-step reasoning plan covering the points above",
+    "action": "fetch_data|analyze_data|ask_clarification|generate_response",
+    "data_sources": ["list", "of", "sources", "needed"],
+    "filters": {
+        "contributions": {"fiscal_year": "2024-25", "state_code": "CA"}
+    },
+    "analysis": "What you plan to do with this data",
+    "response_format": "total|top_n|narrative"
+}
+
+Set "response_format" to "total" when the answer is a single total amount, "top_n"
+when it is a ranked list of top contributions, and "narrative" otherwise.
+
+Only request data sources and filters you actually need to answer the query.""")
+
+
+# Static instructions for the response node, sent ahead of the per-query sections
+RESPONSE_SYSTEM_MESSAGE = SystemMessage(content="""You are an AI assistant providing the final response to a user's fundraising data query. You have completed a full analysis workflow and now need to present your findings.
+
+INSTRUCTIONS FOR YOUR RESPONSE:
+1. **Direct Answer**: Start with a clear, direct answer to their specific question
+2. **Supporting Data**: Use the actual numbers and metrics from your analysis
+3. **Key Insights**: Highlight the most important findings from your analysis
+4. **Methodology**: Briefly explain how you arrived at these conclusions
+5. **Actionable Recommendations**: Provide specific, actionable next steps if appropriate
+6. **Professional Tone**: Be conversational but professional
+7. **Completeness**: Ensure you've fully addressed their question
+
+RESPONSE STRUCTURE:
+- Lead with the direct answer
+- Support with specific data points
+- Explain key insights
+- Provide recommendations if relevant
+- Acknowledge any limitations
+
+The query, your reasoning, plans and analysis results follow.""")
+
+# Per-call prompt bodies, filled with str.format_map so only the substitutions run per query
+_REASONING_PROMPT_TMPL = """CONTEXT:
+- Current conversation: {context}
+- User query: "{query}"
+
+JSON PLAN:"""
+
+_RESPONSE_PROMPT_TMPL = """ORIGINAL USER QUERY: "{query}"
+
+YOUR REASONING PROCESS: {reasoning}
+
+DATA FETCHING PLAN: {fetch_plan}
+
+ANALYSIS PERFORMED: {analysis_plan}
+
+ANALYSIS RESULTS:
+{analysis_results}
+
+DATA SUMMARY: {data_summary}
+
+CONVERSATION CONTEXT: {conversation}
+
+Generate a comprehensive, data-driven response:"""
+
+
+def _to_columns(data: List[Dict[str, Any]], value_types) -> Dict[str, List[Any]]:
+    """Pivot records into per-field columns, keeping only values of the given types"""
+    columns: Dict[str, List[Any]] = defaultdict(list)
+    for record in data:
+        for key, value in record.items():
+            if isinstance(value, value_types) and not isinstance(value, bool):
+                columns[key].append(value)
+    return columns
+
+
+def _load_json_response(content: str) -> Any:
+    """Parse JSON from an LLM response, tolerating markdown code fences"""
+    return orjson.loads(_JSON_FENCE_RE.sub("", content.strip()))
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values orjson can't serialize natively (models, dataclasses, Decimal)"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+# Indentation costs input tokens without telling the model anything, so it is
+# only used when prompts are being read by a person
+_PROMPT_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if settings.DEBUG_PROMPTS else 0)
+
+
+def _dumps(value: Any) -> str:
+    """Serialize a value for an LLM prompt, indented only when DEBUG_PROMPTS is set"""
+    return orjson.dumps(value, default=_json_default, option=_PROMPT_JSON_OPTIONS).decode()
+
+
+def _summarize_msg(msg: ChatMessage) -> str:
+    """Clip a chat message for prompt context, dropping embedded code/JSON blocks"""
+    content = _CODE_BLOCK_RE.sub("[data omitted]", msg.content).strip()
+    if len(content) > CONTEXT_MESSAGE_MAX_CHARS:
+        content = content[:CONTEXT_MESSAGE_MAX_CHARS].rstrip() + "..."
+    return content
+
+
+def _recent_context(state: AgentState) -> List[Dict[str, str]]:
+    """
+    Summarized recent user/assistant messages, computed once per conversation length.
+
+    The reasoning and response nodes both read this, so the result is kept in
+    user_context together with the message count it was built from.
+    """
+    cached = state.user_context.get('_recent_ctx')
+    if cached and cached[0] == len(state.messages):
+        return cached[1]
+
+    recent = [
+        {"role": msg.role.value, "content": _summarize_msg(msg)}
+        for msg in state.messages[-CONTEXT_MESSAGE_COUNT:]
+        if msg.role in _CONTEXT_ROLES
+    ]
+    state.user_context['_recent_ctx'] = (len(state.messages), recent)
+    return recent
+
+
+def _render_structured_answer(state: AgentState) -> Optional[str]:
+    """
+    Render the answer from a template when the reasoner asked for a structured
+    format over contributions and the latest analysis has exactly that shape;
+    None otherwise.
+    """
+    template = state.user_context.get('response_template')
+    if template not in ("total", "top_n") or not state.analysis_results or not state.data_context:
+        return None
+    
+    plan = state.user_context.get('analysis_plan') or {}
+    if (plan.get("primary_analysis") or {}).get("data_source") != "contributions":
+        return None
+    
+    latest = state.analysis_results[-1]
+    metrics = latest.data[0] if latest.data else {}
+    primary = metrics.get("primary_analysis") or {}
+    if metrics.get("secondary_analysis") or "error" in primary:
+        return None
+    
+    # Totals and rankings count the same statuses as the repository reports
+    counted = [
+        contribution for contribution in state.data_context.contributions
+        if contribution.get('status') in _COUNTED_CONTRIBUTION_STATUSES
+    ]
+    
+    if template == "total":
+        if "sums" not in primary:
+            return None
+        total = sum(contribution['amount'] for contribution in counted)
+        return TOTAL_ANSWER_TEMPLATE.format(total=float(total), records=len(counted))
+    
+    if "top_10" not in primary:
+        return None
+    top_records = heapq.nlargest(10, counted, key=lambda contribution: contribution['amount'])
+    names = {funder['id']: funder['name'] for funder in state.data_context.funders}
+    if not top_records or any(record['funder_id'] not in names for record in top_records):
+        # Without every funder's name the LLM phrases the answer instead of listing raw IDs
+        return None
+    lines = "\n".join(
+        TOP_N_LINE_TEMPLATE.format(rank=rank, name=names[record['funder_id']], amount=float(record['amount']))
+        for rank, record in enumerate(top_records, 1)
+    )
+    return TOP_N_ANSWER_TEMPLATE.format(count=len(top_records), lines=lines)
 
 
 class AIAgentTools:
@@ -35,7 +343,41 @@ class AIAgentTools:
     def __init__(self, repository_factory: RepositoryFactory):
         self.repository_factory = repository_factory
     
-    @tool
+    def as_langchain_tools(self) -> List[BaseTool]:
+        """
+        Wrap the tool methods for registration with a LangChain tool-calling agent.
+        
+        The workflow nodes call the methods directly, so the tool wrapper's argument
+        validation and callbacks only run when an agent actually invokes them.
+        """
+        return [
+            tool(method)
+            for method in (
+                self.get_funders_data,
+                self.get_contributions_data,
+                self.get_states_data,
+                self.get_state_targets_data,
+                self.get_prospects_data,
+                self.calculate_metrics
+            )
+        ]
+    
+    async def _find_records(self, repository, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Fetch records through the repository's field indexes.
+        
+        Filter keys that are not fields of the repository's model are ignored,
+        matching the previous scan-and-compare behaviour.
+        """
+        if filters:
+            model_fields = repository.model_class.model_fields
+            field_filters = {key: value for key, value in filters.items() if key in model_fields}
+            entities = await repository.find(**field_filters)
+        else:
+            entities = await repository.get_all()
+        
+        return [entity.to_dict() for entity in entities]
+    
     async def get_funders_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch funder data from the database.
@@ -47,33 +389,13 @@ class AIAgentTools:
             List of funder records
         """
         try:
-            funder_repo = self.repository_factory.get_funder_repository()
-            funders = await funder_repo.get_all()
-            
-            # Apply filters if provided
-            if filters:
-                filtered_funders = []
-                for funder in funders:
-                    funder_dict = funder.to_dict()
-                    matches = True
-                    
-                    for key, value in filters.items():
-                        if key in funder_dict and funder_dict[key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        filtered_funders.append(funder_dict)
-                
-                return filtered_funders
-            
-            return [funder.to_dict() for funder in funders]
+            funder_repo = self.repository_factory.funder_repository
+            return await self._find_records(funder_repo, filters)
             
         except Exception as e:
             logger.error(f"Error fetching funders: {e}")
             return []
     
-    @tool
     async def get_contributions_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch contribution data from the database.
@@ -85,33 +407,13 @@ class AIAgentTools:
             List of contribution records
         """
         try:
-            contribution_repo = self.repository_factory.get_contribution_repository()
-            contributions = await contribution_repo.get_all()
-            
-            # Apply filters if provided
-            if filters:
-                filtered_contributions = []
-                for contribution in contributions:
-                    contrib_dict = contribution.to_dict()
-                    matches = True
-                    
-                    for key, value in filters.items():
-                        if key in contrib_dict and contrib_dict[key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        filtered_contributions.append(contrib_dict)
-                
-                return filtered_contributions
-            
-            return [contribution.to_dict() for contribution in contributions]
+            contribution_repo = self.repository_factory.contribution_repository
+            return await self._find_records(contribution_repo, filters)
             
         except Exception as e:
             logger.error(f"Error fetching contributions: {e}")
             return []
     
-    @tool
     async def get_states_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch state data from the database.
@@ -123,32 +425,13 @@ class AIAgentTools:
             List of state records
         """
         try:
-            state_repo = self.repository_factory.get_state_repository()
-            states = await state_repo.get_all()
-            
-            if filters:
-                filtered_states = []
-                for state in states:
-                    state_dict = state.to_dict()
-                    matches = True
-                    
-                    for key, value in filters.items():
-                        if key in state_dict and state_dict[key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        filtered_states.append(state_dict)
-                
-                return filtered_states
-            
-            return [state.to_dict() for state in states]
+            state_repo = self.repository_factory.state_repository
+            return await self._find_records(state_repo, filters)
             
         except Exception as e:
             logger.error(f"Error fetching states: {e}")
             return []
     
-    @tool
     async def get_state_targets_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch state target data from the database.
@@ -160,32 +443,13 @@ class AIAgentTools:
             List of state target records
         """
         try:
-            target_repo = self.repository_factory.get_state_target_repository()
-            targets = await target_repo.get_all()
-            
-            if filters:
-                filtered_targets = []
-                for target in targets:
-                    target_dict = target.to_dict()
-                    matches = True
-                    
-                    for key, value in filters.items():
-                        if key in target_dict and target_dict[key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        filtered_targets.append(target_dict)
-                
-                return filtered_targets
-            
-            return [target.to_dict() for target in targets]
+            target_repo = self.repository_factory.state_target_repository
+            return await self._find_records(target_repo, filters)
             
         except Exception as e:
             logger.error(f"Error fetching state targets: {e}")
             return []
     
-    @tool
     async def get_prospects_data(self, filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """
         Fetch prospect data from the database.
@@ -197,32 +461,13 @@ class AIAgentTools:
             List of prospect records
         """
         try:
-            prospect_repo = self.repository_factory.get_prospect_repository()
-            prospects = await prospect_repo.get_all()
-            
-            if filters:
-                filtered_prospects = []
-                for prospect in prospects:
-                    prospect_dict = prospect.to_dict()
-                    matches = True
-                    
-                    for key, value in filters.items():
-                        if key in prospect_dict and prospect_dict[key] != value:
-                            matches = False
-                            break
-                    
-                    if matches:
-                        filtered_prospects.append(prospect_dict)
-                
-                return filtered_prospects
-            
-            return [prospect.to_dict() for prospect in prospects]
+            prospect_repo = self.repository_factory.prospect_repository
+            return await self._find_records(prospect_repo, filters)
             
         except Exception as e:
             logger.error(f"Error fetching prospects: {e}")
             return []
     
-    @tool
     async def calculate_metrics(self, data: List[Dict[str, Any]], metric_type: str) -> Dict[str, Any]:
         """
         Calculate various metrics from data.
@@ -239,50 +484,28 @@ class AIAgentTools:
                 return {"error": "No data provided"}
             
             if metric_type == "sum":
-                # Sum numeric fields
-                numeric_fields = {}
-                for record in data:
-                    for key, value in record.items():
-                        if isinstance(value, (int, float)):
-                            if key not in numeric_fields:
-                                numeric_fields[key] = 0
-                            numeric_fields[key] += value
+                # Sum numeric fields column by column
+                numeric_columns = _to_columns(data, _NUMERIC_TYPES)
+                numeric_fields = {key: sum(values) for key, values in numeric_columns.items()}
                 return {"sums": numeric_fields, "total_records": len(data)}
             
             elif metric_type == "average":
                 # Calculate averages
-                numeric_fields = {}
-                counts = {}
-                for record in data:
-                    for key, value in record.items():
-                        if isinstance(value, (int, float)):
-                            if key not in numeric_fields:
-                                numeric_fields[key] = 0
-                                counts[key] = 0
-                            numeric_fields[key] += value
-                            counts[key] += 1
-                
-                averages = {key: total / counts[key] for key, total in numeric_fields.items() if counts[key] > 0}
+                numeric_columns = _to_columns(data, _NUMERIC_TYPES)
+                averages = {key: sum(values) / len(values) for key, values in numeric_columns.items()}
                 return {"averages": averages, "total_records": len(data)}
             
             elif metric_type == "count":
                 # Count by categories
-                field_counts = {}
-                for record in data:
-                    for key, value in record.items():
-                        if isinstance(value, str):
-                            if key not in field_counts:
-                                field_counts[key] = {}
-                            if value not in field_counts[key]:
-                                field_counts[key][value] = 0
-                            field_counts[key][value] += 1
+                string_columns = _to_columns(data, str)
+                field_counts = {key: dict(Counter(values)) for key, values in string_columns.items()}
                 return {"counts": field_counts, "total_records": len(data)}
             
             elif metric_type == "top_n":
                 # Find top performers (assuming 'amount' field exists)
                 if 'amount' in data[0]:
-                    sorted_data = sorted(data, key=lambda x: x.get('amount', 0), reverse=True)
-                    return {"top_10": sorted_data[:10], "total_records": len(data)}
+                    top_records = heapq.nlargest(10, data, key=lambda x: x.get('amount', 0))
+                    return {"top_10": top_records, "total_records": len(data)}
                 else:
                     return {"error": "No 'amount' field found for ranking"}
             
@@ -294,6 +517,197 @@ class AIAgentTools:
             return {"error": str(e)}
 
 
+class PreflightNode(BaseWorkflowNode):
+    """
+    Node that answers empty queries, greetings and disallowed requests with a
+    canned reply before any lookup or LLM call happens.
+    """
+    
+    def __init__(self):
+        super().__init__("preflight", "Canned replies for trivial or disallowed queries")
+    
+    async def execute(self, state: AgentState) -> AgentState:
+        """Reply directly when the query needs no data or reasoning"""
+        query = state.current_query.strip()
+        
+        if not query:
+            response = EMPTY_QUERY_RESPONSE
+        elif _DENYLIST_RE.search(query):
+            response = REFUSAL_RESPONSE
+        elif _GREETING_RE.match(query):
+            response = GREETING_RESPONSE
+        else:
+            state.user_context['preflight_answered'] = False
+            return state
+        
+        state.add_message(ChatMessage(
+            role=MessageRole.ASSISTANT,
+            content=response,
+            context={"preflight": True}
+        ))
+        state.user_context['preflight_answered'] = True
+        state.update_workflow_step("response_generated")
+        self.log_execution(state, "Answered in preflight")
+        return state
+
+
+class ResponseCacheNode(BaseWorkflowNode):
+    """
+    Node that serves repeated standalone queries from the response cache
+    and stores fresh answers once the workflow has produced them.
+    """
+    
+    def __init__(self, repository_factory: RepositoryFactory):
+        super().__init__("response_cache", "Serve and store cached query responses")
+        self.repository_factory = repository_factory
+        self.cache = get_response_cache()
+    
+    async def execute(self, state: AgentState) -> AgentState:
+        """Answer from the cache when the same standalone query was answered recently"""
+        # Follow-up questions depend on earlier turns, so only opening questions are cached
+        cacheable = not any(msg.role == MessageRole.ASSISTANT for msg in state.messages)
+        data_version = self.repository_factory.get_data_version()
+        
+        state.user_context['response_cache_hit'] = False
+        state.user_context['response_cacheable'] = cacheable
+        state.user_context['response_data_version'] = data_version
+        
+        if not cacheable:
+            return state
+        
+        cached_response = self.cache.get(state.current_query, data_version)
+        if cached_response is None:
+            return state
+        
+        state.add_message(ChatMessage(
+            role=MessageRole.ASSISTANT,
+            content=cached_response,
+            context={"cached": True}
+        ))
+        state.user_context['response_cache_hit'] = True
+        state.update_workflow_step("response_generated")
+        self.log_execution(state, "Served response from cache")
+        return state
+    
+    async def store(self, state: AgentState) -> AgentState:
+        """Cache the generated answer for later identical queries"""
+        if (
+            state.user_context.get('response_cacheable')
+            and not state.error_state
+            and not state.user_context.get('response_degraded')
+            and not state.needs_clarification
+            and state.messages
+            and state.messages[-1].role == MessageRole.ASSISTANT
+        ):
+            self.cache.set(
+                state.current_query,
+                state.user_context['response_data_version'],
+                state.messages[-1].content
+            )
+        return state
+
+
+class FastPathNode(BaseWorkflowNode):
+    """
+    Node that answers simple, pattern-matchable queries without calling the LLM.
+    Unmatched queries continue to AI reasoning unchanged.
+    """
+    
+    def __init__(self, tools: AIAgentTools):
+        super().__init__("fast_path", "Rule-based answers for simple queries")
+        self.tools = tools
+        self.routes = [
+            (_TOP_FUNDERS_RE, self._top_funders),
+            (_TOTAL_CONTRIBUTIONS_RE, self._total_contributions)
+        ]
+    
+    async def execute(self, state: AgentState) -> AgentState:
+        """Answer the query directly if it matches a known pattern"""
+        state.user_context['skip_llm'] = False
+        query = state.current_query.strip()
+        
+        for pattern, handler in self.routes:
+            match = pattern.match(query)
+            if not match:
+                continue
+            
+            try:
+                result = await handler(match)
+            except Exception as e:
+                logger.error(f"Fast path failed, falling back to AI reasoning: {e}")
+                return state
+            
+            state.add_analysis_result(result)
+            state.user_context['skip_llm'] = True
+            state.update_workflow_step("fast_path_complete")
+            self.log_execution(state, f"Answered without LLM via {handler.__name__}")
+            return state
+        
+        return state
+    
+    async def _top_funders(self, match: re.Match) -> AnalysisResult:
+        """Rank funders by their total contribution amount"""
+        n = int(match.group(1))
+        contributions, funders = await asyncio.gather(
+            self.tools.get_contributions_data(),
+            self.tools.get_funders_data()
+        )
+        
+        totals: Dict[str, Decimal] = defaultdict(Decimal)
+        for contribution in contributions:
+            if contribution['status'] in _COUNTED_CONTRIBUTION_STATUSES:
+                totals[contribution['funder_id']] += contribution['amount']
+        
+        names = {funder['id']: funder['name'] for funder in funders}
+        ranked = [
+            {"funder_id": funder_id, "name": names.get(funder_id, funder_id), "total_amount": float(amount)}
+            for funder_id, amount in heapq.nlargest(n, totals.items(), key=lambda item: item[1])
+        ]
+        
+        if ranked:
+            lines = [f"{i}. {row['name']}: ${row['total_amount']:,.2f}" for i, row in enumerate(ranked, 1)]
+            summary = f"Top {len(ranked)} funders by total contributions:\n" + "\n".join(lines)
+        else:
+            summary = "No contributions were found to rank funders by."
+        
+        return AnalysisResult(
+            type=AnalysisType.FUNDER_ANALYSIS,
+            summary=summary,
+            data=ranked,
+            metrics={"funders_ranked": len(ranked)},
+            confidence_score=1.0,
+            methodology="Sum of confirmed and received contribution amounts per funder"
+        )
+    
+    async def _total_contributions(self, match: re.Match) -> AnalysisResult:
+        """Sum contribution amounts, optionally for one state and fiscal year"""
+        state_code, fiscal_year = match.group(1), match.group(2)
+        filters = {}
+        if state_code:
+            filters['state_code'] = state_code.upper()
+        if fiscal_year:
+            filters['fiscal_year'] = fiscal_year
+        
+        contributions = [
+            contribution
+            for contribution in await self.tools.get_contributions_data(filters or None)
+            if contribution['status'] in _COUNTED_CONTRIBUTION_STATUSES
+        ]
+        total = float(sum(contribution['amount'] for contribution in contributions))
+        
+        scope = "".join([
+            f" in {filters['state_code']}" if state_code else "",
+            f" for {fiscal_year}" if fiscal_year else ""
+        ])
+        return AnalysisResult(
+            type=AnalysisType.CONTRIBUTION_HISTORY,
+            summary=f"Total confirmed and received contributions{scope}: ${total:,.2f} across {len(contributions)} contributions.",
+            metrics={"total_amount": total, "contribution_count": len(contributions)},
+            confidence_score=1.0,
+            methodology="Sum of confirmed and received contribution amounts"
+        )
+
+
 class AIReasoningNode(BaseWorkflowNode):
     """
     AI reasoning node that uses Gemini AI to understand queries and make decisions.
@@ -304,82 +718,77 @@ class AIReasoningNode(BaseWorkflowNode):
         super().__init__("ai_reasoner", "AI reasoning and decision making")
         self.tools = tools
         
-        # Initialize Gemini AI
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY environment variable is required")
+        # Shared Gemini client
+        self.llm = get_llm(temperature=0.1, max_tokens=2048)
+        self.llm_cache = get_llm_cache()
         
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
-            google_api_key=api_key,
-            temperature=0.1,
-            max_tokens=2048
-        )
+        # Cheaper model for condensing older conversation turns
+        self.summary_llm = get_llm(model="gemini-1.5-flash", temperature=0.1, max_tokens=512)
         
-        # System prompt for the AI agent
-        self.system_prompt = """You are an intelligent AI agent for a fundraising intelligence platform. You are designed to think step-by-step and create detailed plans to answer user queries.
-
-AVAILABLE TOOLS:
-- get_funders_data(filters): Fetch funder information with optional filters
-- get_contributions_data(filters): Fetch contribution records with optional filters
-- get_states_data(filters): Fetch state information with optional filters  
-- get_state_targets_data(filters): Fetch state target data with optional filters
-- get_prospects_data(filters): Fetch prospect information with optional filters
-- calculate_metrics(data, metric_type): Calculate metrics (sum, average, count, top_n, trend)
-
-YOUR REASONING PROCESS:
-1. **UNDERSTAND**: Analyze the user's question - what exactly are they asking?
-2. **PLAN**: Create a step-by-step plan to answer their question
-3. **DATA STRATEGY**: Determine what specific data you need and why
-4. **ANALYSIS STRATEGY**: Plan what calculations/analysis will provide the answer
-5. **RESPONSE STRATEGY**: Plan how to present the findings clearly
-
-CONTEXT:
-- Current conversation: {context}
-- User query: "{query}"
-
-TASK: Create a detailed reasoning plan that explains:
-1. What the user is asking for (be specific)
-2. What data you need to fetch and why
-3. What analysis you'll perform on that data
-4. How this will answer their question
-5. Any potential challenges or limitations
-
-Think step-by-step and be thorough in your reasoning. Your plan will guide the next steps in the workflow.
-
-REASONING PLAN:"""
+        # Rolling summaries updated in the background after each answer, by session
+        self._summary_tasks: "OrderedDict[str, asyncio.Task]" = OrderedDict()
     
     async def execute(self, state: AgentState) -> AgentState:
         """Use AI to reason about the query and determine next actions"""
         self.log_execution(state, "Starting AI reasoning process")
         
-        # Prepare context for the AI
+        # Warm the caches of the repositories the query mentions while the model is reasoning
+        likely_repositories = {
+            name
+            for pattern, names in _REPOSITORY_HINTS if pattern.search(state.current_query)
+            for name in names
+        }
+        if likely_repositories:
+            self.tools.repository_factory.start_prefetch(likely_repositories)
+        
+        # Older turns are folded into a rolling summary; only the latest stay verbatim
+        self._apply_rolling_summary(state)
+        
+        # Prepare context for the AI. The session id is left out: it tells the model
+        # nothing and would make every cache key unique to one session.
         context = {
-            "conversation_history": [msg.to_dict() for msg in state.messages[-5:]],  # Last 5 messages
-            "session_id": state.session_id,
-            "previous_results": [result.summary for result in state.analysis_results[-3:]]  # Last 3 results
+            "conversation_summary": state.user_context.get('rolling_summary', ''),
+            "recent_messages": _recent_context(state)[-RECENT_MESSAGE_COUNT:],
+            "previous_results": [
+                {"summary": result.summary, "insights": result.insights[:3]}
+                for result in state.analysis_results[-3:]
+            ]  # Last 3 results, without raw data
         }
         
-        # Create the reasoning prompt
-        reasoning_prompt = self.system_prompt.format(
-            context=json.dumps(context, indent=2),
-            query=state.current_query
-        )
+        # Only the context and query vary per call; the instructions are a fixed prefix
+        reasoning_prompt = _REASONING_PROMPT_TMPL.format_map({
+            "context": _dumps(context),
+            "query": state.current_query
+        })
         
         try:
             # Get AI reasoning
-            messages = [SystemMessage(content=reasoning_prompt)]
-            response = await self.llm.ainvoke(messages)
+            messages = [REASONING_SYSTEM_MESSAGE, HumanMessage(content=reasoning_prompt)]
+            response = await self.llm_cache.ainvoke(self.llm, messages)
             
-            # Parse the AI's plan
+            # Parse the AI's plan; it carries the data plan so tool execution
+            # doesn't need a second round-trip
             ai_plan = response.content
+            try:
+                plan = _load_json_response(ai_plan)
+            except orjson.JSONDecodeError:
+                plan = None
+            
+            if isinstance(plan, dict):
+                ai_reasoning = str(plan.get('reasoning', ai_plan))
+                state.user_context['plan'] = plan
+                state.user_context['response_template'] = plan.get('response_format')
+            else:
+                ai_reasoning = ai_plan
+                state.user_context.pop('plan', None)
+                state.user_context.pop('response_template', None)
             
             # Store the AI's reasoning in state
-            state.user_context['ai_reasoning'] = ai_plan
+            state.user_context['ai_reasoning'] = ai_reasoning
             state.user_context['reasoning_timestamp'] = datetime.utcnow().isoformat()
             
             # Determine next action based on AI reasoning
-            next_action = self._parse_ai_plan(ai_plan)
+            next_action = self._parse_ai_plan(plan, ai_reasoning)
             state.user_context['next_action'] = next_action
             
             state.update_workflow_step("ai_reasoning_complete")
@@ -394,19 +803,83 @@ REASONING PLAN:"""
             state.set_error(error_msg)
             return state
     
-    def _parse_ai_plan(self, ai_plan: str) -> str:
+    async def schedule_rolling_summary(self, state: AgentState) -> AgentState:
+        """
+        Start folding older messages into the rolling summary once a turn is answered.
+        
+        The summary call runs in the background so it never delays a response;
+        the next turn picks up the result if it has finished by then.
+        """
+        # Everything except the latest reply: on the next turn that reply and the
+        # new query are the verbatim recent messages
+        older_messages = state.messages[:len(state.messages) - RECENT_MESSAGE_COUNT + 1]
+        summarized_count = state.user_context.get('rolling_summary_count', 0)
+        if len(older_messages) <= summarized_count:
+            return state
+        
+        previous = self._summary_tasks.pop(state.session_id, None)
+        if previous is not None:
+            previous.cancel()
+        self._summary_tasks[state.session_id] = asyncio.create_task(self._summarize(
+            state.user_context.get('rolling_summary'),
+            older_messages[summarized_count:],
+            len(older_messages)
+        ))
+        while len(self._summary_tasks) > MAX_PENDING_SUMMARIES:
+            _, stale = self._summary_tasks.popitem(last=False)
+            stale.cancel()
+        return state
+    
+    def _apply_rolling_summary(self, state: AgentState) -> None:
+        """Adopt the summary computed after the previous turn, if it is ready"""
+        task = self._summary_tasks.get(state.session_id)
+        if task is None or not task.done():
+            return
+        del self._summary_tasks[state.session_id]
+        result = None if task.cancelled() else task.result()
+        if result is not None:
+            state.user_context['rolling_summary'], state.user_context['rolling_summary_count'] = result
+    
+    async def _summarize(
+        self,
+        current_summary: Optional[str],
+        new_messages: List[ChatMessage],
+        summarized_count: int
+    ) -> Optional[Tuple[str, int]]:
+        """Update a rolling summary with new messages; None if the model call fails"""
+        new_text = "\n".join(f"{msg.role.value}: {msg.content}" for msg in new_messages)
+        summary_prompt = f"""Update the running summary of a conversation with a fundraising intelligence assistant.
+Keep the entities, filters, figures and open questions that later turns may refer to. Reply with the summary only, in at most 150 words.
+
+CURRENT SUMMARY:
+{current_summary or "(none)"}
+
+NEW MESSAGES:
+{new_text}"""
+        
+        try:
+            response = await self.llm_cache.ainvoke(self.summary_llm, [HumanMessage(content=summary_prompt)])
+            return response.content.strip(), summarized_count
+        except Exception as e:
+            # Keep the previous summary; the recent messages still carry the latest context
+            logger.error(f"Error updating conversation summary: {e}")
+            return None
+    
+    def _parse_ai_plan(self, plan: Optional[Dict[str, Any]], ai_reasoning: str) -> str:
         """Parse the AI's plan to determine the next workflow action"""
-        plan_lower = ai_plan.lower()
-        
-        # Look for keywords that indicate the type of action needed
-        if any(keyword in plan_lower for keyword in ['fetch', 'get', 'retrieve', 'data']):
-            return "fetch_data"
-        elif any(keyword in plan_lower for keyword in ['calculate', 'analyze', 'compute', 'metrics']):
-            return "analyze_data"
-        elif any(keyword in plan_lower for keyword in ['clarify', 'unclear', 'need more', 'question']):
-            return "ask_clarification"
-        else:
-            return "generate_response"
+        if plan and plan.get('action') in _WORKFLOW_ACTIONS:
+            return plan['action']
+        
+        # Free-text plan: single keyword scan; earlier actions take precedence
+        best_rank = len(_PLAN_ACTIONS)
+        for match in _PLAN_KEYWORD_RE.finditer(ai_reasoning):
+            best_rank = min(best_rank, _PLAN_KEYWORD_RANK[match.group(0).lower()])
+            if best_rank == 0:
+                break
+        
+        if best_rank < len(_PLAN_ACTIONS):
+            return _PLAN_ACTIONS[best_rank][0]
+        return "generate_response"
 
 
 class AIToolExecutionNode(BaseWorkflowNode):
@@ -419,13 +892,32 @@ class AIToolExecutionNode(BaseWorkflowNode):
         super().__init__("tool_executor", "Execute AI-selected tools")
         self.tools = tools
         
-        # Initialize Gemini for tool selection
-        api_key = os.getenv("GEMINI_API_KEY")
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
-            google_api_key=api_key,
-            temperature=0.1
-        )
+        # Gemini for tool selection; no output cap so long tool plans aren't truncated
+        self.llm = get_llm(temperature=0.1)
+        self.llm_cache = get_llm_cache()
+        
+        # Cheap, fast model for low-complexity calls (JSON repair, clarification wording);
+        # Pro stays on reasoning, planning and the final response
+        self.flash_llm = get_llm(model="gemini-1.5-flash", temperature=0.0, max_tokens=2048)
+    
+    async def _parse_json_plan(self, content: str) -> Dict[str, Any]:
+        """
+        Parse a JSON plan from an LLM response.
+        
+        Markdown code fences are stripped first. If the text still isn't valid
+        JSON, the flash model is asked once to reformat it before giving up.
+        """
+        try:
+            return _load_json_response(content)
+        except orjson.JSONDecodeError:
+            logger.warning("AI plan was not valid JSON, asking for a reformatted copy")
+        
+        messages = [
+            SystemMessage(content="Return strictly the JSON object contained in the user's message, with no code fences or commentary."),
+            HumanMessage(content=content)
+        ]
+        response = await self.llm_cache.ainvoke(self.flash_llm, messages)
+        return _load_json_response(response.content)
     
     async def execute(self, state: AgentState) -> AgentState:
         """Execute tools based on AI reasoning"""
@@ -434,6 +926,10 @@ class AIToolExecutionNode(BaseWorkflowNode):
         ai_reasoning = state.user_context.get('ai_reasoning', '')
         next_action = state.user_context.get('next_action', 'generate_response')
         
+        if next_action in ("fetch_data", "analyze_data"):
+            # Tool calls below are served from the caches warmed during reasoning
+            await self.tools.repository_factory.await_prefetch()
+        
         if next_action == "fetch_data":
             await self._fetch_data_intelligently(state, ai_reasoning)
         elif next_action == "analyze_data":
@@ -447,9 +943,66 @@ class AIToolExecutionNode(BaseWorkflowNode):
         return state
     
     async def _fetch_data_intelligently(self, state: AgentState, ai_reasoning: str):
-        """Use AI to determine what data to fetch and how"""
-        
-        # Ask AI what specific data to fetch with detailed reasoning
+        """Fetch the data chosen by the reasoning plan, asking the AI only if it had none"""
+        try:
+            plan = state.user_context.get('plan') or {}
+            if plan.get('data_sources'):
+                data_plan = {
+                    "reasoning": ai_reasoning,
+                    "data_sources": plan['data_sources'],
+                    "filters": plan.get('filters') or {},
+                    "expected_analysis": plan.get('analysis', '')
+                }
+            else:
+                data_plan = await self._request_data_plan(state, ai_reasoning)
+            
+            self.log_execution(state, f"AI data plan: {data_plan['reasoning']}")
+            
+            # Fetch the requested data based on AI decision
+            data_context = DataContext()
+            source_fetchers = {
+                "funders": self.tools.get_funders_data,
+                "contributions": self.tools.get_contributions_data,
+                "states": self.tools.get_states_data,
+                "state_targets": self.tools.get_state_targets_data,
+                "prospects": self.tools.get_prospects_data
+            }
+            
+            # Sources are independent of each other, so fetch them concurrently
+            sources = []
+            tasks = []
+            for source in data_plan.get("data_sources", []):
+                if source not in source_fetchers or source in sources:
+                    continue
+                filters = data_plan.get("filters", {}).get(source, None)
+                
+                self.log_execution(state, f"Fetching {source} data with filters: {filters}")
+                
+                sources.append(source)
+                tasks.append(source_fetchers[source](filters))
+            
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            
+            for source, result in zip(sources, results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error fetching {source} data: {result}")
+                    continue
+                setattr(data_context, source, result)
+            
+            state.data_context = data_context
+            state.user_context['data_fetch_plan'] = data_plan
+            
+            # Log what data was actually fetched
+            summary = data_context.get_data_summary()
+            self.log_execution(state, f"Data fetched: {summary}")
+            
+        except Exception as e:
+            logger.error(f"Error in intelligent data fetching: {e}")
+            # Fallback to basic data fetching
+            await self._fetch_basic_data(state)
+    
+    async def _request_data_plan(self, state: AgentState, ai_reasoning: str) -> Dict[str, Any]:
+        """Ask the AI what data to fetch when the reasoning plan didn't specify it"""
         data_prompt = f"""You are an intelligent AI agent analyzing this user query: "{state.current_query}"
 
 Your previous reasoning was: {ai_reasoning}
@@ -481,54 +1034,22 @@ Respond with a JSON object that specifies your data fetching strategy:
 
 Be specific and only request data you actually need to answer the query."""
         
-        try:
-            messages = [SystemMessage(content=data_prompt)]
-            response = await self.llm.ainvoke(messages)
-            
-            # Parse the AI's data requirements
-            data_plan = json.loads(response.content)
-            
-            self.log_execution(state, f"AI data plan: {data_plan['reasoning']}")
-            
-            # Fetch the requested data based on AI decision
-            data_context = DataContext()
-            
-            for source in data_plan.get("data_sources", []):
-                filters = data_plan.get("filters", {}).get(source, None)
-                
-                self.log_execution(state, f"Fetching {source} data with filters: {filters}")
-                
-                if source == "funders":
-                    data_context.funders = await self.tools.get_funders_data(filters)
-                elif source == "contributions":
-                    data_context.contributions = await self.tools.get_contributions_data(filters)
-                elif source == "states":
-                    data_context.states = await self.tools.get_states_data(filters)
-                elif source == "state_targets":
-                    data_context.state_targets = await self.tools.get_state_targets_data(filters)
-                elif source == "prospects":
-                    data_context.prospects = await self.tools.get_prospects_data(filters)
-            
-            state.data_context = data_context
-            state.user_context['data_fetch_plan'] = data_plan
-            
-            # Log what data was actually fetched
-            summary = data_context.get_data_summary()
-            self.log_execution(state, f"Data fetched: {summary}")
-            
-        except Exception as e:
-            logger.error(f"Error in intelligent data fetching: {e}")
-            # Fallback to basic data fetching
-            await self._fetch_basic_data(state)
+        messages = [SystemMessage(content=data_prompt)]
+        response = await self.llm_cache.ainvoke(self.llm, messages)
+        
+        # Parse the AI's data requirements
+        return await self._parse_json_plan(response.content)
     
     async def _fetch_basic_data(self, state: AgentState):
         """Fallback method to fetch basic data"""
         data_context = DataContext()
         
-        # Fetch all basic data
-        data_context.funders = await self.tools.get_funders_data()
-        data_context.contributions = await self.tools.get_contributions_data()
-        data_context.states = await self.tools.get_states_data()
+        # Fetch all basic data concurrently
+        data_context.funders, data_context.contributions, data_context.states = await asyncio.gather(
+            self.tools.get_funders_data(),
+            self.tools.get_contributions_data(),
+            self.tools.get_states_data()
+        )
         
         state.data_context = data_context
     
@@ -547,11 +1068,11 @@ Be specific and only request data you actually need to answer the query."""
 Your previous reasoning: {ai_reasoning}
 
 Available data:
-{json.dumps(data_summary, indent=2)}
+{state.data_context.summary_json}
 
 Sample of the actual data you have access to:
-- Funders sample: {json.dumps(state.data_context.funders[:2] if state.data_context.funders else [], indent=2)}
-- Contributions sample: {json.dumps(state.data_context.contributions[:2] if state.data_context.contributions else [], indent=2)}
+- Funders sample: {state.data_context.sample_json("funders")}
+- Contributions sample: {state.data_context.sample_json("contributions")}
 
 Now decide what specific analysis to perform. Think through:
 1. What calculations will answer the user's question?
@@ -585,23 +1106,25 @@ Respond with a detailed JSON analysis plan:
         
         try:
             messages = [SystemMessage(content=analysis_prompt)]
-            response = await self.llm.ainvoke(messages)
+            response = await self.llm_cache.ainvoke(self.llm, messages)
             
-            analysis_plan = json.loads(response.content)
+            analysis_plan = await self._parse_json_plan(response.content)
             
             self.log_execution(state, f"AI analysis plan: {analysis_plan['reasoning']}")
             
-            # Perform primary analysis
+            # Perform primary and (optional) secondary analysis concurrently
             primary = analysis_plan["primary_analysis"]
             primary_data = getattr(state.data_context, primary["data_source"])
-            primary_metrics = await self.tools.calculate_metrics(primary_data, primary["analysis_type"])
+            metric_tasks = [self.tools.calculate_metrics(primary_data, primary["analysis_type"])]
             
-            # Perform secondary analysis if specified
-            secondary_metrics = {}
             if "secondary_analysis" in analysis_plan:
                 secondary = analysis_plan["secondary_analysis"]
                 secondary_data = getattr(state.data_context, secondary["data_source"])
-                secondary_metrics = await self.tools.calculate_metrics(secondary_data, secondary["analysis_type"])
+                metric_tasks.append(self.tools.calculate_metrics(secondary_data, secondary["analysis_type"]))
+            
+            metric_results = await asyncio.gather(*metric_tasks)
+            primary_metrics = metric_results[0]
+            secondary_metrics = metric_results[1] if len(metric_results) > 1 else {}
             
             # Combine results
             combined_metrics = {
@@ -654,7 +1177,7 @@ Respond with just the clarification question, nothing else."""
         
         try:
             messages = [SystemMessage(content=clarification_prompt)]
-            response = await self.llm.ainvoke(messages)
+            response = await self.llm_cache.ainvoke(self.flash_llm, messages)
             
             clarification_question = response.content.strip()
             
@@ -675,13 +1198,7 @@ class AIResponseGenerationNode(BaseWorkflowNode):
     def __init__(self):
         super().__init__("ai_response_generator", "Generate AI-powered responses")
         
-        api_key = os.getenv("GEMINI_API_KEY")
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-pro",
-            google_api_key=api_key,
-            temperature=0.3,
-            max_tokens=1024
-        )
+        self.llm = get_llm(temperature=0.3, max_tokens=1024)
     
     async def execute(self, state: AgentState) -> AgentState:
         """Generate intelligent response based on analysis and context"""
@@ -702,8 +1219,15 @@ class AIResponseGenerationNode(BaseWorkflowNode):
             state.update_workflow_step("clarification_requested")
             return state
         
-        # Generate comprehensive response
-        response_content = await self._generate_comprehensive_response(state)
+        # Fast-path answers are already phrased, and plain totals or rankings
+        # render from a template; only narrative answers need the LLM
+        if state.user_context.get('skip_llm') and state.analysis_results:
+            response_content = state.analysis_results[-1].summary
+        else:
+            response_content = _render_structured_answer(state)
+            if response_content is None:
+                # Generate comprehensive response
+                response_content = await self._generate_comprehensive_response(state)
         
         response_message = ChatMessage(
             role=MessageRole.ASSISTANT,
@@ -726,50 +1250,28 @@ class AIResponseGenerationNode(BaseWorkflowNode):
         
         # Get the latest analysis result
         latest_analysis = state.analysis_results[-1] if state.analysis_results else None
+        data_summary = state.data_context.get_data_summary() if state.data_context else {}
         
-        # Prepare detailed context for response generation
-        response_prompt = f"""You are an AI assistant providing the final response to a user's fundraising data query. You have completed a full analysis workflow and now need to present your findings.
-
-ORIGINAL USER QUERY: "{state.current_query}"
-
-YOUR REASONING PROCESS: {state.user_context.get('ai_reasoning', 'No reasoning available')}
-
-DATA FETCHING PLAN: {json.dumps(state.user_context.get('data_fetch_plan', {}), indent=2)}
-
-ANALYSIS PERFORMED: {json.dumps(state.user_context.get('analysis_plan', {}), indent=2)}
-
-ANALYSIS RESULTS:
-{json.dumps(latest_analysis.to_dict() if latest_analysis else {}, indent=2)}
-
-DATA SUMMARY: {json.dumps(state.data_context.get_data_summary() if state.data_context else {}, indent=2)}
-
-CONVERSATION CONTEXT: {[msg.content for msg in state.messages[-3:]] if state.messages else []}
-
-INSTRUCTIONS FOR YOUR RESPONSE:
-1. **Direct Answer**: Start with a clear, direct answer to their specific question
-2. **Supporting Data**: Use the actual numbers and metrics from your analysis
-3. **Key Insights**: Highlight the most important findings from your analysis
-4. **Methodology**: Briefly explain how you arrived at these conclusions
-5. **Actionable Recommendations**: Provide specific, actionable next steps if appropriate
-6. **Professional Tone**: Be conversational but professional
-7. **Completeness**: Ensure you've fully addressed their question
-
-RESPONSE STRUCTURE:
-- Lead with the direct answer
-- Support with specific data points
-- Explain key insights
-- Provide recommendations if relevant
-- Acknowledge any limitations
-
-Generate a comprehensive, data-driven response:"""
+        # Only the query-specific sections vary; the instructions are a fixed system prefix
+        response_prompt = _RESPONSE_PROMPT_TMPL.format_map({
+            "query": state.current_query,
+            "reasoning": state.user_context.get('ai_reasoning', 'No reasoning available'),
+            "fetch_plan": _dumps(state.user_context.get('data_fetch_plan', {})),
+            "analysis_plan": _dumps(state.user_context.get('analysis_plan', {})),
+            "analysis_results": _dumps(latest_analysis or {}),
+            "data_summary": _dumps(data_summary),
+            "conversation": _dumps(_recent_context(state))
+        })
         
         try:
-            messages = [SystemMessage(content=response_prompt)]
+            messages = [RESPONSE_SYSTEM_MESSAGE, HumanMessage(content=response_prompt)]
             response = await self.llm.ainvoke(messages)
             return response.content
             
         except Exception as e:
             logger.error(f"Error generating AI response: {e}")
+            # Fallback text must not be served from the response cache on later turns
+            state.user_context['response_degraded'] = True
             
             # Create a fallback response using available data
             if latest_analysis:
@@ -780,7 +1282,7 @@ Generate a comprehensive, data-driven response:"""
 Key insights:
 {chr(10).join(f"• {insight}" for insight in latest_analysis.insights)}
 
-The analysis was performed on {state.data_context.get_data_summary() if state.data_context else 'available data'}.
+The analysis was performed on {data_summary or 'available data'}.
 
 Note: There was a technical issue generating the full response, but the core analysis above should address your question."""
             else:
@@ -799,11 +1301,17 @@ class QueryAnalysisWorkflow(BaseWorkflow):
         
         # Initialize tools and nodes
         self.tools = AIAgentTools(repository_factory)
+        self.preflight = PreflightNode()
+        self.response_cache = ResponseCacheNode(repository_factory)
+        self.fast_path = FastPathNode(self.tools)
         self.ai_reasoner = AIReasoningNode(self.tools)
         self.tool_executor = AIToolExecutionNode(self.tools)
         self.response_generator = AIResponseGenerationNode()
         
         # Add nodes to workflow
+        self.add_node(self.preflight)
+        self.add_node(self.response_cache)
+        self.add_node(self.fast_path)
         self.add_node(self.ai_reasoner)
         self.add_node(self.tool_executor)
         self.add_node(self.response_generator)
@@ -815,12 +1323,48 @@ class QueryAnalysisWorkflow(BaseWorkflow):
         workflow = StateGraph(AgentState)
         
         # Add nodes
-        workflow.add_node("ai_reasoning", self.ai_reasoner.execute)
-        workflow.add_node("tool_execution", self.tool_executor.execute)
-        workflow.add_node("response_generation", self.response_generator.execute)
+        # Each node is timed so per-node latency ends up in state.metadata
+        workflow.add_node("preflight", self.preflight.timed())
+        workflow.add_node("cache_lookup", self.response_cache.timed())
+        workflow.add_node("fast_path", self.fast_path.timed())
+        workflow.add_node("ai_reasoning", self.ai_reasoner.timed())
+        workflow.add_node("tool_execution", self.tool_executor.timed())
+        workflow.add_node("response_generation", self.response_generator.timed())
+        workflow.add_node("cache_store", self.response_cache.timed(self.response_cache.store))
+        workflow.add_node("rolling_summary", self.ai_reasoner.timed(self.ai_reasoner.schedule_rolling_summary))
         
         # Add edges with conditional routing
-        workflow.add_edge(START, "ai_reasoning")
+        workflow.add_edge(START, "preflight")
+        
+        # Greetings, empty and disallowed queries get a canned reply right away
+        workflow.add_conditional_edges(
+            "preflight",
+            self._route_after_preflight,
+            {
+                "cache_lookup": "cache_lookup",
+                "end": END
+            }
+        )
+        
+        # Repeated standalone queries are answered from the response cache
+        workflow.add_conditional_edges(
+            "cache_lookup",
+            self._route_after_cache_lookup,
+            {
+                "fast_path": "fast_path",
+                "end": END
+            }
+        )
+        
+        # Simple queries answered by rules skip straight to the response
+        workflow.add_conditional_edges(
+            "fast_path",
+            self._route_after_fast_path,
+            {
+                "ai_reasoning": "ai_reasoning",
+                "response_generation": "response_generation"
+            }
+        )
         
         # Conditional routing based on AI decisions
         workflow.add_conditional_edges(
@@ -834,11 +1378,31 @@ class QueryAnalysisWorkflow(BaseWorkflow):
         )
         
         workflow.add_edge("tool_execution", "response_generation")
-        workflow.add_edge("response_generation", END)
+        workflow.add_edge("response_generation", "cache_store")
+        workflow.add_edge("cache_store", "rolling_summary")
+        workflow.add_edge("rolling_summary", END)
         
         # Compile and return
         return workflow.compile()
     
+    def _route_after_preflight(self, state: AgentState) -> str:
+        """End the workflow when preflight already replied"""
+        if state.user_context.get('preflight_answered'):
+            return "end"
+        return "cache_lookup"
+    
+    def _route_after_cache_lookup(self, state: AgentState) -> str:
+        """End the workflow when the response came from the cache"""
+        if state.user_context.get('response_cache_hit'):
+            return "end"
+        return "fast_path"
+    
+    def _route_after_fast_path(self, state: AgentState) -> str:
+        """Route to the response when the fast path already answered the query"""
+        if state.user_context.get('skip_llm'):
+            return "response_generation"
+        return "ai_reasoning"
+    
     def _route_after_reasoning(self, state: AgentState) -> str:
         """Route workflow based on AI reasoning results"""
         
@@ -3,13 +3,16 @@ FastAPI application entry point for LangGraph AI Assistant service.
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 import uvicorn
 import logging
+import sys
 
 from app.core.config import settings
 from app.api.v1.api import api_router
-from app.core.logging import setup_logging
+from app.core.logging import setup_logging, shutdown_logging
+from app.services.langgraph_service_v2 import get_langgraph_service_v2
 
 # Setup logging
 setup_logging()
@@ -20,8 +23,22 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting LangGraph AI Assistant service...")
+    
+    # Build the agent and compile its graph before the first request arrives;
+    # chat routes get the same service instance through get_langgraph_service_v2
+    try:
+        service = get_langgraph_service_v2()
+        await service.initialize()
+        app.state.langgraph_service = service
+        
+        if settings.WARMUP_ON_START:
+            await service.warm_up()
+    except Exception as e:
+        logger.error(f"Failed to initialize LangGraph service at startup: {e}")
+    
     yield
     logger.info("Shutting down LangGraph AI Assistant service...")
+    shutdown_logging()
 
 
 # Create FastAPI application
@@ -29,7 +46,8 @@ app = FastAPI(
     title="LangGraph AI Assistant",
     description="Advanced AI assistant powered by LangGraph for fundraising intelligence",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware
@@ -71,5 +89,7 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=settings.PORT,
         reload=settings.DEBUG,
+        # Require uvloop rather than silently falling back; it is unavailable on Windows
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
         log_level="info"
     )
\ No newline at end of file